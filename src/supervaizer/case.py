@@ -553,12 +553,15 @@ class Case(CaseAbstractModel):
 class Cases:
     """Global registry for all cases, organized by job."""
 
+    __slots__ = ("cases_by_job",)
+
     def __init__(self) -> None:
         # Structure: {job_id: {case_id: Case}}
         self.cases_by_job: dict[str, dict[str, Case]] = {}
 
     def reset(self) -> None:
-        self.cases_by_job.clear()
+        # Rebind rather than clear: iterations over the old dict are unaffected
+        self.cases_by_job = {}
 
     def add_case(self, case: "Case") -> None:
         """Add a case to the registry under its job
@@ -17,6 +17,7 @@ import os
 import sys
 import traceback
 from collections.abc import Callable
+from datetime import datetime
 from typing import Any, TextIO, TypeVar, cast
 
 import demjson3
@@ -31,6 +32,8 @@ log = logger.bind(module="supervaize")
 T = TypeVar("T")
 STRUCTURED_LOG_FORMAT_ENV = "SUPERVAIZER_LOG_FORMAT"
 STRUCTURED_LOG_FORMAT_JSON = "json"
+# Leaf types returned unchanged by SvBaseModel.serialize_value (exact type match).
+_SERIALIZE_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
 _DEFAULT_LOG_FORMAT = (
     "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green>|"
     "<level> {level}</level> | <level>{message}</level>"
@@ -103,8 +106,9 @@ class SvBaseModel(BaseModel):
         Dicts and lists are processed recursively. Used by ``to_dict``, job/case
         ``registration_info`` metadata, and ``send_event`` HTTP bodies.
         """
-        from datetime import datetime
-
+        if type(value) in _SERIALIZE_PASSTHROUGH_TYPES:
+            # Most leaves are plain scalars: skip the isinstance chain
+            return value
         if isinstance(value, type):
             # Convert type objects to their string name
             return value.__name__
@@ -32,12 +32,15 @@ from supervaizer.storage import storage_manager
 class Jobs:
     """Global registry for all jobs, organized by agent."""
 
+    __slots__ = ("jobs_by_agent",)
+
     def __init__(self) -> None:
         # Structure: {agent_name: {job_id: Job}}
         self.jobs_by_agent: dict[str, dict[str, Job]] = {}
 
     def reset(self) -> None:
-        self.jobs_by_agent.clear()
+        # Rebind rather than clear: iterations over the old dict are unaffected
+        self.jobs_by_agent = {}
 
     def add_job(self, job: "Job") -> None:
         """Add a job to the registry under its agent
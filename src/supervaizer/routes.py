@@ -11,6 +11,7 @@
 # https://mozilla.org/MPL/2.0/.
 
 import asyncio
+import json
 import traceback
 from collections.abc import Awaitable, Callable
 from functools import wraps
@@ -42,12 +43,17 @@ from supervaizer.agent import (
     AgentResponse,
 )
 from supervaizer.case import CaseNodeUpdate, Cases
-from supervaizer.common import SvBaseModel, log
+from supervaizer.common import SvBaseModel, decrypt_value, log
 from supervaizer.contracts import controller_contract_info
 from supervaizer.job import Job, JobContext, JobResponse, Jobs
 from supervaizer.job_service import service_job_custom, service_job_start
 from supervaizer.lifecycle import EntityStatus
-from supervaizer.server_utils import ErrorResponse, ErrorType, create_error_response
+from supervaizer.server_utils import (
+    ErrorResponse,
+    ErrorType,
+    OrjsonResponse,
+    create_error_response,
+)
 
 if TYPE_CHECKING:
     from enum import Enum
@@ -539,7 +545,7 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
         "/validate-agent-parameters",
         summary=f"Validate agent parameters for agent: {agent.name}",
         description="Validate agent configuration parameters (secrets, API keys, etc.) before starting a job",
-        response_model=dict[str, Any],
+        response_model=None,
         responses={
             http_status.HTTP_200_OK: {"model": dict[str, Any]},
             http_status.HTTP_400_BAD_REQUEST: {"model": dict[str, Any]},
@@ -553,7 +559,7 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
     async def validate_agent_parameters(
         body_params: Any = Body(...),
         agent: Agent = Depends(get_agent),
-    ) -> dict[str, Any]:
+    ) -> OrjsonResponse:
         """Validate agent parameters for this agent"""
         log.info(
             f"📥 POST /validate-agent-parameters [Validate agent parameters] {agent.name}"
@@ -567,7 +573,7 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
                 "invalid_parameters": {},
             }
             log.info(f"📤 Agent {agent.name}: No parameter setup defined → {result}")
-            return result
+            return OrjsonResponse(content=result)
 
         if body_params is None:
             body_params = {}
@@ -582,10 +588,6 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
             )
 
             try:
-                import json
-
-                from supervaizer.common import decrypt_value
-
                 agent_parameters_str = decrypt_value(
                     encrypted_agent_parameters, server.private_key
                 )
@@ -625,7 +627,7 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
                 }
                 # Do not log the result payload: it can echo parameter data.
                 log.info(f"📤 Agent {agent.name}: Decryption failed")
-                return result
+                return OrjsonResponse(content=result)
 
         # Log the incoming request details.
         # Never log decrypted parameter values (secrets); log only presence/count.
@@ -656,13 +658,13 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
             f"{'passed' if validation_result['valid'] else 'failed'} "
             f"({len(validation_result['errors'])} error(s))"
         )
-        return result
+        return OrjsonResponse(content=result)
 
     @router.post(
         "/validate-method-fields",
         summary=f"Validate method fields for agent: {agent.name}",
         description="Validate job input fields against the method's field definitions before starting a job",
-        response_model=dict[str, Any],
+        response_model=None,
         responses={
             http_status.HTTP_200_OK: {"model": dict[str, Any]},
             http_status.HTTP_400_BAD_REQUEST: {"model": dict[str, Any]},
@@ -676,7 +678,7 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
     async def validate_method_fields(
         body_params: Any = Body(...),
         agent: Agent = Depends(get_agent),
-    ) -> dict[str, Any]:
+    ) -> OrjsonResponse:
         """Validate method fields for this agent"""
         log.info(
             f"📥 POST /validate-method-fields [Validate method fields] {agent.name}"
@@ -702,7 +704,7 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
                 "invalid_fields": {},
             }
             log.info(f"📤 Agent {agent.name}: No methods defined → {result}")
-            return result
+            return OrjsonResponse(content=result)
 
         if method_name == "job_start":
             method = agent.methods.job_start
@@ -718,7 +720,7 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
             log.info(
                 f"📤 Agent {agent.name}: Method '{method_name}' not found → {result}"
             )
-            return result
+            return OrjsonResponse(content=result)
 
         # Validate method fields
         validation_result = method.validate_method_fields(job_fields)
@@ -733,7 +735,7 @@ def create_agent_route(server: "Server", agent: Agent) -> APIRouter:
         log.info(
             f"📤 Agent {agent.name}: Method '{method_name}' validation result → {result}"
         )
-        return result
+        return OrjsonResponse(content=result)
 
     if not agent.methods:
         raise ValueError(f"Agent {agent.name} has no methods defined")
@@ -11,10 +11,13 @@
 # https://mozilla.org/MPL/2.0/.
 
 
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
+from typing import Any
 
-from fastapi.encoders import jsonable_encoder
+import orjson
 from fastapi.responses import JSONResponse
 from loguru import logger as log
 from pydantic import BaseModel
@@ -31,6 +34,23 @@ class ErrorType(str, Enum):
     INVALID_PARAMETERS = "invalid_parameters"
 
 
+# Human-readable error titles ("job_not_found" -> "Job Not Found"), built once
+_ERROR_TITLES: Mapping[ErrorType, str] = MappingProxyType({
+    error_type: error_type.value.replace("_", " ").title() for error_type in ErrorType
+})
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson (FastAPI's ORJSONResponse is deprecated).
+
+    Enums, datetimes and Pydantic-dumped values serialize natively, so content
+    does not need a jsonable_encoder pass first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 class ErrorResponse(BaseModel):
     """Standard error response model"""
 
@@ -46,7 +66,7 @@ def create_error_response(
 ) -> JSONResponse:
     """Helper function to create consistent error responses"""
     error_response = ErrorResponse(
-        error=error_type.value.replace("_", " ").title(),
+        error=_ERROR_TITLES[error_type],
         error_type=error_type,
         detail=detail,
         status_code=status_code,
@@ -54,7 +74,7 @@ def create_error_response(
     log.error(detail)
     if traceback:
         log.error(traceback)
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status_code,
-        content=jsonable_encoder(error_response),
+        content=error_response.model_dump(),
     )
@@ -6,14 +6,23 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import os
+import sys
 import threading
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from tinydb import Query, TinyDB
-from tinydb.storages import MemoryStorage
+import orjson
+from pydantic import BaseModel
+from tinydb import TinyDB
+from tinydb.storages import JSONStorage, MemoryStorage
 
+from supervaizer import lifecycle
 from supervaizer.common import log, singleton
 from supervaizer.lifecycle import WorkflowEntity
 
@@ -25,6 +34,35 @@ class _MemoryStorage(MemoryStorage):
         super().__init__(*args)
 
 
+class _OrjsonStorage(JSONStorage):
+    """JSONStorage serialized with orjson: sorted keys, two-space indent.
+
+    TinyDB rewrites the whole file on every write, so the encoder dominates
+    file-backed saves. The file is opened in binary mode to skip text decoding.
+    """
+
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        kwargs.pop("sort_keys", None)
+        kwargs.pop("indent", None)
+        super().__init__(path, access_mode="rb+", **kwargs)
+
+    def read(self) -> dict[str, dict[str, Any]] | None:
+        self._handle.seek(0)
+        data = self._handle.read()
+        # An empty file lets TinyDB initialize the database
+        return orjson.loads(data) if data else None
+
+    def write(self, data: dict[str, dict[str, Any]]) -> None:
+        self._handle.seek(0)
+        self._handle.write(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+        # Ensure the data reaches the disk, then drop any leftover old content
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.truncate()
+
+
 if TYPE_CHECKING:
     from supervaizer.case import Case
     from supervaizer.job import Job
@@ -33,6 +71,15 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound=WorkflowEntity)
 
+# Number of per-type lock stripes in StorageManager (must be a power of two).
+_LOCK_STRIPES = 16
+# Write-behind: objects persisted per TinyDB critical section, and how long the
+# background writer lets a burst of save_object_async calls coalesce.
+_WRITE_BATCH_SIZE = 128
+_WRITE_BEHIND_DELAY = 0.05
+# Pause before the writer retries documents whose write failed
+_WRITE_RETRY_DELAY = 1.0
+
 DATA_STORAGE_PATH = os.getenv("DATA_STORAGE_PATH", "./data")
 
 # When False (default), use in-memory storage only (e.g. Vercel, serverless).
@@ -53,6 +100,7 @@ class StorageManager:
     represented as ID references (Job.case_ids, Case.job_id).
 
     When SUPERVAIZER_PERSISTENCE is false (default), uses in-memory storage only.
+    Reads are served lock-free from a snapshot that writers republish on change.
     """
 
     def __init__(self, db_path: str | None = None):
@@ -63,7 +111,14 @@ class StorageManager:
             db_path: Path to the TinyDB JSON file, or None to use env-based
                      persistence (file if SUPERVAIZER_PERSISTENCE=true, else memory).
         """
+        # All TinyDB tables share a single storage backend, so document I/O (and
+        # the doc_id map that addresses it) is serialized behind one lock
+        # regardless of the entity type.
         self._lock = threading.Lock()
+        # Striped per-type locks guard snapshot merges and publication: operations
+        # on unrelated types use distinct stripes and only meet on _lock around
+        # the TinyDB calls. Lock order is always stripe, then _lock.
+        self._locks = tuple(threading.RLock() for _ in range(_LOCK_STRIPES))
         # Explicit file path (e.g. tests) uses file; else file only if persistence enabled
         use_file = (db_path is not None and db_path != ":memory:") or (
             db_path is None and PERSISTENCE_ENABLED
@@ -75,17 +130,79 @@ class StorageManager:
                 else f"{DATA_STORAGE_PATH}/entities.json"
             )
             self.db_path = Path(path)
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            self._db = TinyDB(path, sort_keys=True, indent=2)
+            # The only directory check: writes reuse the storage's open handle
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = TinyDB(path, storage=_OrjsonStorage)
         else:
             # In-memory only (default for Vercel/serverless)
             self.db_path = Path(":memory:")
             self._db = TinyDB(storage=_MemoryStorage, sort_keys=True, indent=2)
 
+        # Read-copy-update snapshot of every table: {type: {id: document}}.
+        # Writers build a new per-type dict and publish it by assigning its
+        # key under the type's stripe; published per-type dicts are never
+        # modified, so readers never take a lock.
+        self._snapshot: dict[str, dict[str, dict[str, Any]]] = {}
+        # TinyDB doc_id of every stored object ({type: {id: doc_id}}), so writes
+        # address documents directly instead of evaluating a query per row.
+        self._doc_ids: dict[str, dict[str, int]] = {}
+        for table_name in self._db.tables():
+            # Table names parsed from the db file are not interned like the
+            # class names and literals later used to look them up
+            name = sys.intern(table_name)
+            objects: dict[str, dict[str, Any]] = {}
+            doc_ids: dict[str, int] = {}
+            for doc in self._db.table(name).all():
+                obj_id = doc.get("id")
+                if not obj_id:
+                    # No object can address it: ignore it, as id queries did
+                    log.warning(
+                        f"[StorageManager] §SSSS04 Skipped {name} document {doc.doc_id} without an 'id'"
+                    )
+                    continue
+                objects[obj_id] = dict(doc)
+                doc_ids[obj_id] = doc.doc_id
+            self._snapshot[name] = objects
+            self._doc_ids[name] = doc_ids
+        # Secondary index job_id -> case ids, republished copy-on-write
+        # alongside the snapshot so get_cases_for_job avoids a table scan.
+        self._cases_by_job: dict[str, tuple[str, ...]] = {}
+        for case_id, case in self._snapshot.get("Case", {}).items():
+            self._reindex_case(case_id, None, case.get("job_id"))
+
+        # Write-behind queue for save_object_async: an ordered set of
+        # (type, id) keys whose snapshot document still has to reach TinyDB.
+        self._pending: dict[tuple[str, str], None] = {}
+        self._pending_cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._writer_stopping = False
+
         # log.debug(
         #    f"[StorageManager] 🗃️ Local DB initialized at {self.db_path.absolute()}"
         # )
 
+    def _lock_for(self, type: str) -> threading.RLock:
+        """Return the lock stripe guarding the given object type."""
+        return self._locks[hash(type) & (_LOCK_STRIPES - 1)]
+
+    def _reindex_case(
+        self, case_id: str, old_job_id: str | None, new_job_id: str | None
+    ) -> None:
+        """Move a case between job_id index entries. Caller holds the Case stripe."""
+        if old_job_id == new_job_id:
+            return
+        # Readers only look up single keys: entries are replaced, never mutated
+        index = self._cases_by_job
+        if old_job_id is not None:
+            remaining = tuple(c for c in index.get(old_job_id, ()) if c != case_id)
+            if remaining:
+                index[old_job_id] = remaining
+            else:
+                index.pop(old_job_id, None)
+        if new_job_id is not None:
+            index[new_job_id] = (*index.get(new_job_id, ()), case_id)
+
     def save_object(self, type: str, obj: dict[str, Any]) -> None:
         """
         Save an object to the appropriate table.
@@ -94,20 +211,239 @@ class StorageManager:
             type: The object type (class name)
             obj: Dictionary representation of the object
         """
-        with self._lock:
-            table = self._db.table(type)
-            obj_id = obj.get("id")
+        obj_id = self._require_id(obj)
+        with self._lock_for(type):
+            document = self._publish(type, obj_id, obj)
+            with self._lock:
+                self._write_document(type, obj_id, document)
+
+            # log.debug(f"Saved object with ID: {type} {obj_id} - {obj}")
+
+    def save_objects_bulk(self, type: str, objs: list[dict[str, Any]]) -> None:
+        """
+        Save several objects of one type in a single critical section.
 
-            if not obj_id:
-                raise ValueError(
-                    f"[StorageManager] §SSSS01 Object must have an 'id' field: {obj}"
+        The snapshot is republished once for the whole batch and new objects
+        reach TinyDB with a single insert.
+
+        Args:
+            type: The object type (class name)
+            objs: Dictionary representations of the objects
+        """
+        obj_ids = [self._require_id(obj) for obj in objs]
+        with self._lock_for(type):
+            objects = self._snapshot.get(type, {}).copy()
+            for obj_id, obj in zip(obj_ids, objs, strict=True):
+                existing = objects.get(obj_id)
+                document = {**existing, **obj} if existing else dict(obj)
+                if type == "Case":
+                    self._reindex_case(
+                        obj_id,
+                        existing.get("job_id") if existing else None,
+                        document.get("job_id"),
+                    )
+                objects[obj_id] = document
+            # Publish before writing, as _publish does, so a concurrent flush
+            # never writes an older document over this batch.
+            self._snapshot[self._snapshot_key(type)] = objects
+
+            with self._lock:
+                # Each object is written once, with its final merged state
+                self._write_documents(
+                    type, {obj_id: objects[obj_id] for obj_id in obj_ids}
                 )
 
-            # Use upsert to handle both new and existing objects
-            query = Query()
-            table.upsert(obj, query.id == obj_id)
+    def save_object_async(self, type: str, obj: dict[str, Any]) -> None:
+        """
+        Save an object, deferring the TinyDB write to a background writer.
 
-            # log.debug(f"Saved object with ID: {type} {obj_id} - {obj}")
+        The object is visible to readers immediately; repeated saves of the
+        same object before the writer runs collapse into a single write.
+
+        Args:
+            type: The object type (class name)
+            obj: Dictionary representation of the object
+        """
+        obj_id = self._require_id(obj)
+        with self._lock_for(type):
+            document = self._publish(type, obj_id, obj)
+            with self._pending_cond:
+                closed = self._writer_stopping
+                if not closed:
+                    self._pending[(type, obj_id)] = None
+                    if self._writer is None:
+                        self._start_writer()
+                    if len(self._pending) >= _WRITE_BATCH_SIZE:
+                        self._pending_cond.notify()
+            if closed:
+                # After close() nothing drains the queue: write through, as
+                # save_object does
+                with self._lock:
+                    self._write_document(type, obj_id, document)
+
+    def flush(self) -> None:
+        """Persist every object queued by save_object_async.
+
+        A document that fails to write on an I/O or TinyDB error is logged and
+        queued again; one that cannot be serialized is logged and dropped.
+        """
+        self._flush()
+
+    def _flush(self) -> bool:
+        """Drain the write-behind queue; return False if any write must retry."""
+        failed: list[tuple[str, str]] = []
+        with self._flush_lock:
+            while True:
+                with self._pending_cond:
+                    batch = list(islice(self._pending, _WRITE_BATCH_SIZE))
+                    for key in batch:
+                        del self._pending[key]
+                if not batch:
+                    break
+                by_type: dict[str, list[str]] = {}
+                for type, obj_id in batch:
+                    by_type.setdefault(type, []).append(obj_id)
+                for type, obj_ids in by_type.items():
+                    failed.extend(
+                        (type, obj_id) for obj_id in self._write_batch(type, obj_ids)
+                    )
+            if failed:
+                # Requeue for the next flush; the snapshot keeps the latest state
+                with self._pending_cond:
+                    self._pending.update(dict.fromkeys(failed))
+        return not failed
+
+    def _write_batch(self, type: str, obj_ids: list[str]) -> list[str]:
+        """Write queued objects of one type; return the ids to retry."""
+        with self._lock:
+            # Write the latest published state; skip deleted objects
+            objects = self._snapshot.get(type, {})
+            documents = {
+                obj_id: objects[obj_id] for obj_id in obj_ids if obj_id in objects
+            }
+            try:
+                self._write_documents(type, documents)
+                return []
+            except orjson.JSONEncodeError:
+                # Fall through and write one by one to single out the document
+                pass
+            except (OSError, ValueError) as e:
+                log.error(
+                    f"[StorageManager] §SSSS02 Failed to write {len(documents)} {type}: {e}"
+                )
+                return list(documents)
+        retry: list[str] = []
+        for obj_id in documents:
+            with self._lock:
+                document = self._snapshot.get(type, {}).get(obj_id)
+                if document is None:
+                    continue
+                try:
+                    self._write_document(type, obj_id, document)
+                except orjson.JSONEncodeError as e:
+                    log.error(
+                        f"[StorageManager] §SSSS03 Dropped unserializable {type} {obj_id}: {e}"
+                    )
+                except (OSError, ValueError) as e:
+                    log.error(
+                        f"[StorageManager] §SSSS02 Failed to write {type} {obj_id}: {e}"
+                    )
+                    retry.append(obj_id)
+        return retry
+
+    @staticmethod
+    def _require_id(obj: dict[str, Any]) -> str:
+        """Return the object's id, raising ValueError when it is missing."""
+        obj_id = obj.get("id")
+        if not obj_id:
+            raise ValueError(
+                f"[StorageManager] §SSSS01 Object must have an 'id' field: {obj}"
+            )
+        return obj_id
+
+    def _snapshot_key(self, type: str) -> str:
+        """Intern a type name the first time it becomes a snapshot key."""
+        return type if type in self._snapshot else sys.intern(type)
+
+    def _publish(self, type: str, obj_id: str, obj: dict[str, Any]) -> dict[str, Any]:
+        """Merge obj into the snapshot and return the stored document.
+
+        Caller holds the type's stripe.
+        """
+        objects = self._snapshot.get(type, {})
+        existing = objects.get(obj_id)
+        # Fields merge into the stored document, as TinyDB's update does
+        document = {**existing, **obj} if existing else dict(obj)
+        if type == "Case":
+            self._reindex_case(
+                obj_id,
+                existing.get("job_id") if existing else None,
+                document.get("job_id"),
+            )
+        # Copy-on-write the per-type dict; the outer dict only gains a key
+        objects = objects.copy()
+        objects[obj_id] = document
+        self._snapshot[self._snapshot_key(type)] = objects
+        return document
+
+    def _write_document(self, type: str, obj_id: str, document: dict[str, Any]) -> None:
+        """Write a full snapshot document to TinyDB. Caller holds _lock."""
+        # Update in place when the object is known, otherwise insert it
+        table = self._db.table(type)
+        doc_ids = self._doc_ids.setdefault(type, {})
+        doc_id = doc_ids.get(obj_id)
+        if doc_id is None:
+            doc_ids[obj_id] = table.insert(document)
+        else:
+            table.update(document, doc_ids=[doc_id])
+
+    def _write_documents(self, type: str, documents: dict[str, dict[str, Any]]) -> None:
+        """Write snapshot documents of one type in at most two storage writes.
+
+        Known documents are updated in one read-modify-write of the table and
+        new ones inserted in another. Caller holds _lock.
+        """
+        table = self._db.table(type)
+        doc_ids = self._doc_ids.setdefault(type, {})
+        known = [doc_ids[obj_id] for obj_id in documents if obj_id in doc_ids]
+        new_ids = [obj_id for obj_id in documents if obj_id not in doc_ids]
+        if known:
+            table.update(lambda doc: doc.update(documents[doc["id"]]), doc_ids=known)
+        if new_ids:
+            inserted = table.insert_multiple(documents[obj_id] for obj_id in new_ids)
+            doc_ids.update(zip(new_ids, inserted, strict=True))
+
+    def _start_writer(self) -> None:
+        """Start the background writer. Caller holds _pending_cond."""
+        self._writer = threading.Thread(
+            target=self._write_behind, name="StorageManager-writer", daemon=True
+        )
+        self._writer.start()
+        # The writer is a daemon thread: persist whatever is still queued at exit
+        atexit.register(self.flush)
+
+    def _write_behind(self) -> None:
+        """Background writer loop draining the save_object_async queue."""
+        while True:
+            with self._pending_cond:
+                self._pending_cond.wait_for(
+                    lambda: bool(self._pending) or self._writer_stopping
+                )
+                if self._writer_stopping:
+                    return
+                # Let a burst coalesce until the batch fills or the delay expires
+                self._pending_cond.wait_for(
+                    lambda: (
+                        len(self._pending) >= _WRITE_BATCH_SIZE or self._writer_stopping
+                    ),
+                    timeout=_WRITE_BEHIND_DELAY,
+                )
+            if not self._flush():
+                # Back off before retrying failed documents
+                with self._pending_cond:
+                    self._pending_cond.wait_for(
+                        lambda: self._writer_stopping, timeout=_WRITE_RETRY_DELAY
+                    )
 
     def get_objects(self, type: str) -> list[dict[str, Any]]:
         """
@@ -117,12 +453,49 @@ class StorageManager:
             type: The object type (class name)
 
         Returns:
-            List of object dictionaries
+            List of object dictionaries (use count/is_empty to only size it)
         """
-        with self._lock:
-            table = self._db.table(type)
-            documents = table.all()
-            return [dict(doc) for doc in documents]
+        return [dict(doc) for doc in self.iter_objects(type)]
+
+    def iter_objects(self, type: str) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all objects of a specific type without copying them.
+
+        The snapshot being iterated is never modified in place, so this is safe
+        while other threads write. The yielded documents are the stored ones:
+        treat them as read-only and use get_objects for copies.
+
+        Args:
+            type: The object type (class name)
+
+        Returns:
+            Iterator over object dictionaries
+        """
+        return iter(self._snapshot.get(type, {}).values())
+
+    def count(self, type: str) -> int:
+        """
+        Count objects of a specific type without materializing them.
+
+        Args:
+            type: The object type (class name)
+
+        Returns:
+            Number of stored objects
+        """
+        return len(self._snapshot.get(type, ()))
+
+    def is_empty(self, type: str) -> bool:
+        """
+        Check whether no object of a specific type is stored.
+
+        Args:
+            type: The object type (class name)
+
+        Returns:
+            True if the type has no objects
+        """
+        return not self._snapshot.get(type)
 
     def get_object_by_id(self, type: str, obj_id: str) -> dict[str, Any] | None:
         """
@@ -135,11 +508,8 @@ class StorageManager:
         Returns:
             Object dictionary if found, None otherwise
         """
-        with self._lock:
-            table = self._db.table(type)
-            query = Query()
-            result = table.search(query.id == obj_id)
-            return result[0] if result else None
+        document = self._snapshot.get(type, {}).get(obj_id)
+        return dict(document) if document is not None else None
 
     def delete_object(self, type: str, obj_id: str) -> bool:
         """
@@ -152,26 +522,49 @@ class StorageManager:
         Returns:
             True if object was deleted, False if not found
         """
-        with self._lock:
-            table = self._db.table(type)
-            query = Query()
-            deleted_count = len(table.remove(query.id == obj_id))
-
-            if deleted_count > 0:
-                log.debug(f"Deleted {type} object with ID: {obj_id}")
-                return True
-            return False
+        with self._lock_for(type):
+            # Unpublish first, so a concurrent flush cannot write the object back
+            objects = self._snapshot.get(type, {})
+            # A save_object_async object may not have reached TinyDB yet
+            published = obj_id in objects
+            if published:
+                if type == "Case":
+                    self._reindex_case(obj_id, objects[obj_id].get("job_id"), None)
+                remaining = objects.copy()
+                del remaining[obj_id]
+                self._snapshot[self._snapshot_key(type)] = remaining
+
+            with self._lock:
+                doc_id = self._doc_ids.get(type, {}).pop(obj_id, None)
+                if doc_id is not None:
+                    self._db.table(type).remove(doc_ids=[doc_id])
+            deleted = doc_id is not None or published
+
+        if deleted:
+            log.debug(f"Deleted {type} object with ID: {obj_id}")
+            return True
+        return False
 
     def reset_storage(self) -> None:
         """
         Reset storage by clearing all tables but preserving the database file.
         """
-        with self._lock:
+        with ExitStack() as stack:
+            # Take every stripe in index order, then the DB lock, so concurrent
+            # resets and per-type operations cannot deadlock.
+            for lock in self._locks:
+                stack.enter_context(lock)
+            stack.enter_context(self._lock)
             # Clear all tables
             for table_name in self._db.tables():
                 self._db.drop_table(table_name)
+            self._snapshot = {}
+            self._doc_ids = {}
+            self._cases_by_job = {}
+            with self._pending_cond:
+                self._pending.clear()
 
-            log.info("Storage reset - all tables cleared")
+        log.info("Storage reset - all tables cleared")
 
     def get_cases_for_job(self, job_id: str) -> list[dict[str, Any]]:
         """
@@ -183,14 +576,25 @@ class StorageManager:
         Returns:
             List of case dictionaries
         """
-        with self._lock:
-            table = self._db.table("Case")
-            query = Query()
-            documents = table.search(query.job_id == job_id)
-            return [dict(doc) for doc in documents]
+        documents = self._snapshot.get("Case", {})
+        return [
+            dict(documents[case_id])
+            for case_id in self._cases_by_job.get(job_id, ())
+            if case_id in documents
+        ]
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Flush pending writes and close the database connection."""
+        with self._pending_cond:
+            writer = self._writer
+            self._writer_stopping = True
+            self._pending_cond.notify()
+        if writer is not None:
+            writer.join()
+        self.flush()
+        # The queue is drained and later async saves write through: the exit
+        # hook must not keep the closed manager alive
+        atexit.unregister(self.flush)
         with self._lock:
             if hasattr(self, "_db") and self._db is not None:
                 try:
@@ -213,7 +617,10 @@ class EntityRepository(Generic[T]):
     """
 
     def __init__(
-        self, entity_class: type[T], storage_manager: StorageManager | None = None
+        self,
+        entity_class: type[T],
+        storage_manager: StorageManager | None = None,
+        trusted: bool = False,
     ):
         """
         Initialize repository for a specific entity type.
@@ -221,10 +628,26 @@ class EntityRepository(Generic[T]):
         Args:
             entity_class: The entity class this repository manages
             storage_manager: Optional storage manager instance
+            trusted: Hydrate Pydantic entities with model_construct, skipping
+                validation. Only for flat models whose stored data is known
+                valid: nested models are left as plain dicts. The data is
+                deep-copied first, as model_construct does not copy it.
         """
         self.entity_class = entity_class
-        self.type_name = entity_class.__name__
+        self.type_name = sys.intern(entity_class.__name__)
         self.storage = storage_manager or StorageManager()
+        # Bound once: save() is the repository's hot write path
+        self._save = self.storage.save_object
+        # Resolve how to build entities once rather than probing per entity
+        self._hydrate: Callable[[dict[str, Any]], T]
+        if trusted and issubclass(entity_class, BaseModel):
+            self._hydrate = lambda data: entity_class.model_construct(
+                **copy.deepcopy(data)
+            )
+        elif hasattr(entity_class, "model_validate"):
+            self._hydrate = entity_class.model_validate  # type: ignore[attr-defined]
+        else:
+            self._hydrate = lambda data: entity_class(**data)
 
     def get_by_id(self, entity_id: str) -> T | None:
         """
@@ -248,8 +671,7 @@ class EntityRepository(Generic[T]):
         Args:
             entity: The entity to save
         """
-        data = self._to_dict(entity)
-        self.storage.save_object(self.type_name, data)
+        self._save(self.type_name, self._to_dict(entity))
 
     def get_all(self) -> list[T]:
         """
@@ -292,84 +714,84 @@ class EntityRepository(Generic[T]):
         Note: This is a simplified implementation. In practice, you might need
         more sophisticated deserialization depending on your entity structure.
         """
-        # For entities inheriting from SvBaseModel (Pydantic), use model construction
-        if hasattr(self.entity_class, "model_validate"):
-            return self.entity_class.model_validate(data)  # type: ignore
-        else:
-            # Fallback for other types
-            return self.entity_class(**data)
+        # model_validate for Pydantic entities, the constructor otherwise
+        return self._hydrate(data)
 
 
-class PersistentEntityLifecycle:
+def persistent_transition(
+    entity: WorkflowEntity,
+    to_status: EntityStatus,
+    storage: StorageManager | None = None,
+) -> tuple[bool, str]:
     """
-    Enhanced EntityLifecycle that automatically persists entity state changes.
+    Transition an entity and automatically persist the change.
 
-    This class wraps the original EntityLifecycle methods to add persistence.
-    """
-
-    @staticmethod
-    def transition(
-        entity: T, to_status: "EntityStatus", storage: StorageManager | None = None
-    ) -> tuple[bool, str]:
-        """
-        Transition an entity and automatically persist the change.
+    Args:
+        entity: The entity to transition
+        to_status: Target status
+        storage: Optional storage manager instance
 
-        Args:
-            entity: The entity to transition
-            to_status: Target status
-            storage: Optional storage manager instance
+    Returns:
+        Tuple of (success, error_message)
+    """
+    # Resolved through the module at call time so patching EntityLifecycle works
+    success, error = lifecycle.EntityLifecycle.transition(entity, to_status)
+
+    # If successful, persist the entity
+    if success:
+        storage_mgr = storage or StorageManager()
+        type_name = type(entity).__name__
+        entity_dict = entity.to_dict if hasattr(entity, "to_dict") else vars(entity)
+        storage_mgr.save_object_async(type_name, entity_dict)
+        log.debug(
+            f"[Storage transition] Auto-persisted {type_name} {entity.id} after transition to {to_status}"
+        )
 
-        Returns:
-            Tuple of (success, error_message)
-        """
-        # Import here to avoid circular imports
-        from supervaizer.lifecycle import EntityLifecycle
+    return success, error
 
-        # Perform the transition
-        success, error = EntityLifecycle.transition(entity, to_status)
 
-        # If successful, persist the entity
-        if success:
-            storage_mgr = storage or StorageManager()
-            entity_dict = entity.to_dict if hasattr(entity, "to_dict") else vars(entity)
-            storage_mgr.save_object(type(entity).__name__, entity_dict)
-            log.debug(
-                f"[Storage transition] Auto-persisted {type(entity).__name__} {entity.id} after transition to {to_status}"
-            )
+def persistent_handle_event(
+    entity: WorkflowEntity,
+    event: EntityEvents,
+    storage: StorageManager | None = None,
+) -> tuple[bool, str]:
+    """
+    Handle an event and automatically persist the change.
 
-        return success, error
+    Args:
+        entity: The entity to handle event for
+        event: The event to handle
+        storage: Optional storage manager instance
 
-    @staticmethod
-    def handle_event(
-        entity: T, event: "EntityEvents", storage: StorageManager | None = None
-    ) -> tuple[bool, str]:
-        """
-        Handle an event and automatically persist the change.
+    Returns:
+        Tuple of (success, error_message)
+    """
+    # Resolved through the module at call time so patching EntityLifecycle works
+    success, error = lifecycle.EntityLifecycle.handle_event(entity, event)
+
+    # If successful, persist the entity
+    if success:
+        storage_mgr = storage or StorageManager()
+        type_name = type(entity).__name__
+        entity_dict = entity.to_dict if hasattr(entity, "to_dict") else vars(entity)
+        storage_mgr.save_object_async(type_name, entity_dict)
+        log.debug(
+            f"[Storage handle_event] Auto-persisted {type_name} {entity.id} after handling event {event}"
+        )
 
-        Args:
-            entity: The entity to handle event for
-            event: The event to handle
-            storage: Optional storage manager instance
+    return success, error
 
-        Returns:
-            Tuple of (success, error_message)
-        """
-        # Import here to avoid circular imports
-        from supervaizer.lifecycle import EntityLifecycle
 
-        # Handle the event
-        success, error = EntityLifecycle.handle_event(entity, event)
+class PersistentEntityLifecycle:
+    """
+    Enhanced EntityLifecycle that automatically persists entity state changes.
 
-        # If successful, persist the entity
-        if success:
-            storage_mgr = storage or StorageManager()
-            entity_dict = entity.to_dict if hasattr(entity, "to_dict") else vars(entity)
-            storage_mgr.save_object(type(entity).__name__, entity_dict)
-            log.debug(
-                f"[Storage handle_event] Auto-persisted {type(entity).__name__} {entity.id} after handling event {event}"
-            )
+    Kept for existing callers: the methods are the persistent_transition and
+    persistent_handle_event functions.
+    """
 
-        return success, error
+    transition = staticmethod(persistent_transition)
+    handle_event = staticmethod(persistent_handle_event)
 
 
 def create_job_repository() -> "EntityRepository[Job]":
@@ -409,15 +831,15 @@ def load_running_entities_on_startup() -> None:
     Cases().reset()
 
     # Load running jobs
-    job_data_list = storage.get_objects("Job")
     loaded_jobs = 0
 
-    for job_data in job_data_list:
+    for job_data in storage.iter_objects("Job"):
         job_status = job_data.get("status")
         if job_status in [status.value for status in EntityStatus.status_running()]:
             try:
-                # Use model_construct to avoid triggering __init__ side effects
-                job = Job.model_construct(**job_data)
+                # Use model_construct to avoid triggering __init__ side effects.
+                # It keeps the given containers, so copy the snapshot document.
+                job = Job.model_construct(**copy.deepcopy(job_data))
                 # Manually add to registry since we bypassed __init__
                 Jobs().add_job(job)
                 loaded_jobs += 1
@@ -430,15 +852,15 @@ def load_running_entities_on_startup() -> None:
                 )
 
     # Load running cases
-    case_data_list = storage.get_objects("Case")
     loaded_cases = 0
 
-    for case_data in case_data_list:
+    for case_data in storage.iter_objects("Case"):
         case_status = case_data.get("status")
         if case_status in [status.value for status in EntityStatus.status_running()]:
             try:
-                # Use model_construct to avoid triggering __init__ side effects
-                case = Case.model_construct(**case_data)
+                # Use model_construct to avoid triggering __init__ side effects.
+                # It keeps the given containers, so copy the snapshot document.
+                case = Case.model_construct(**copy.deepcopy(case_data))
                 # Manually add to registry since we bypassed __init__
                 Cases().add_case(case)
                 loaded_cases += 1
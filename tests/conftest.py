@@ -19,6 +19,7 @@ from uuid import uuid4
 
 import pytest
 from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 
 import supervaizer.storage as storage_module
 from supervaizer import (
@@ -54,10 +55,8 @@ def temp_db_path() -> Generator[str, None, None]:
         yield os.path.join(temp_dir, "test_entities.json")
 
 
-@pytest.fixture
-def storage_manager(temp_db_path: str) -> StorageManager:
-    """Create a clean StorageManager instance for testing."""
-    # Clear the singleton instance to ensure fresh instance
+def _clear_storage_manager_singleton() -> None:
+    """Clear the StorageManager singleton so the next call builds a new instance."""
     # The singleton decorator creates a closure with instances dict
     storage_get_instance = storage_module.StorageManager
     if (
@@ -69,9 +68,20 @@ def storage_manager(temp_db_path: str) -> StorageManager:
             if hasattr(cell.cell_contents, "clear"):
                 cell.cell_contents.clear()
 
+
+@pytest.fixture
+def storage_manager(temp_db_path: str) -> Generator[StorageManager, None, None]:
+    """Create a clean StorageManager instance for testing."""
+    # Clear the singleton instance to ensure fresh instance
+    _clear_storage_manager_singleton()
+
     storage = StorageManager(db_path=temp_db_path)
     storage.reset_storage()  # Ensure clean state
-    return storage
+    yield storage
+    # The db file is shared by the session: flush queued writes and stop the
+    # background writer before the next test opens it again.
+    storage.close()
+    _clear_storage_manager_singleton()
 
 
 @pytest.fixture
@@ -391,15 +401,22 @@ def agent_fixture(
     )
 
 
+@pytest.fixture(scope="session")
+def rsa_private_key_fixture() -> Annotated[RSAPrivateKey, "fixture"]:
+    """Generate the RSA key once per session; keygen dominates Server setup."""
+    return rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=2048,
+    )
+
+
 @pytest.fixture
 def server_fixture(
-    account_fixture: Account, agent_fixture: Agent
+    account_fixture: Account,
+    agent_fixture: Agent,
+    rsa_private_key_fixture: RSAPrivateKey,
 ) -> Annotated[Server, "fixture"]:
     """Create a server fixture."""
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-    )
     return Server(
         scheme="http",
         host="localhost",
@@ -408,7 +425,7 @@ def server_fixture(
         mac_addr="E2-AC-ED-22-BF-B2",
         debug=True,
         agent_timeout=10,
-        private_key=private_key,
+        private_key=rsa_private_key_fixture,
         a2a_endpoints=True,
         supervisor_account=account_fixture,
         agents=[agent_fixture],
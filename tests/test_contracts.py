@@ -97,9 +97,13 @@ def test_contract_models_export_json_schema() -> None:
     assert "release_notes_url" in agent_schema["properties"]
 
 
-def test_contract_module_import_does_not_load_controller_runtime() -> None:
-    sys.modules.pop("supervaizer.server", None)
-    sys.modules.pop("supervaizer.routes", None)
+def test_contract_module_import_does_not_load_controller_runtime(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # monkeypatch restores the original modules so later string-based patches
+    # still target the module objects other tests' fixtures were built from.
+    monkeypatch.delitem(sys.modules, "supervaizer.server", raising=False)
+    monkeypatch.delitem(sys.modules, "supervaizer.routes", raising=False)
     importlib.import_module("supervaizer.contracts")
 
     assert "supervaizer.server" not in sys.modules
@@ -107,3 +107,35 @@ def test_delete_nonexistent_entity(repo: EntityRepository[DummyEntity]) -> None:
 
 def test_get_by_id_not_found(repo: EntityRepository[DummyEntity]) -> None:
     assert repo.get_by_id("doesnotexist") is None
+
+
+def test_trusted_repository_skips_validation(dummy_entity: DummyEntity) -> None:
+    """trusted=True hydrates with model_construct, without validating stored data."""
+    storage = MinimalStorageManager()
+    trusted_repo = EntityRepository(DummyEntity, storage_manager=storage, trusted=True)  # type: ignore
+    validating_repo = EntityRepository(DummyEntity, storage_manager=storage)  # type: ignore
+    storage.save_object("DummyEntity", {"id": dummy_entity.id, "value": "42"})
+
+    loaded = trusted_repo.get_by_id(dummy_entity.id)
+    assert isinstance(loaded, DummyEntity)
+    assert loaded.value == "42"  # stored as-is, not coerced
+
+    validated = validating_repo.get_by_id(dummy_entity.id)
+    assert validated is not None
+    assert validated.value == 42
+
+
+def test_trusted_repository_copies_stored_containers() -> None:
+    """Entities hydrated with model_construct do not alias stored lists."""
+    storage = MinimalStorageManager()
+    trusted_repo = EntityRepository(DummyEntity, storage_manager=storage, trusted=True)  # type: ignore
+    storage.save_object("DummyEntity", {"id": "dummy-1", "value": [1]})
+
+    loaded = trusted_repo.get_by_id("dummy-1")
+    assert loaded is not None
+    loaded.value.append(2)  # type: ignore[attr-defined]
+
+    assert storage.get_object_by_id("DummyEntity", "dummy-1") == {
+        "id": "dummy-1",
+        "value": [1],
+    }
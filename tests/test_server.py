@@ -16,6 +16,7 @@ import json
 import os
 import time
 from typing import Any
+from unittest.mock import ANY
 
 import pytest
 from cryptography.hazmat.primitives import serialization
@@ -33,12 +34,14 @@ from supervaizer.common import ApiSuccess
 from supervaizer.contracts import V2WorkspaceAuthorizationSettings
 from supervaizer.job import Job, JobContext
 from supervaizer.lifecycle import EntityStatus
-from supervaizer.parameter import ParametersSetup
 from supervaizer.server_utils import ErrorType, create_error_response
 from supervaizer.workspace_authorization import WORKSPACE_AUTHORIZATION_HEADER
 
 insp = inspect
 
+# Listening URL of ``server_fixture`` (host/port are fixed in conftest).
+_EXPECTED_URL = "http://localhost:8001"
+
 
 def _enable_workspace_authorization_eddsa(
     server: Server,
@@ -141,6 +144,12 @@ def no_response_validation(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("fastapi.routing.serialize_response", mocked_serialize_response)
 
 
+@pytest.fixture
+def mock_jobs(mocker: Any) -> Any:
+    """Patch the routes' Jobs registry and return the mocked instance."""
+    return mocker.patch("supervaizer.routes.Jobs").return_value
+
+
 def test_server_scheme_validator(
     server_fixture: Server, agent_fixture: Agent, account_fixture: Any
 ) -> None:
@@ -513,26 +522,30 @@ async def test_server_lifespan_leaves_shutdown_after_scheduler_timeout(
 
 def test_server_decrypt(server_fixture: Server) -> None:
     unencrypted_parameters = str({"KEY": "VALUE"})
-    encrypted_parameters = server_fixture.encrypt(unencrypted_parameters)
-    assert encrypted_parameters is not None
-    assert isinstance(encrypted_parameters, str)
-    assert len(encrypted_parameters) > len(unencrypted_parameters)
+    assert (
+        server_fixture.decrypt(server_fixture.encrypt(unencrypted_parameters))
+        == unencrypted_parameters
+    )
+
+
+def test_instructions_method(server_fixture: Server, mocker: Any) -> None:
+    mock_display_instructions = mocker.patch("supervaizer.server.display_instructions")
 
-    decrypted_parameters = server_fixture.decrypt(encrypted_parameters)
-    assert decrypted_parameters == unencrypted_parameters
+    server_fixture.instructions()
+
+    mock_display_instructions.assert_called_once_with(_EXPECTED_URL, ANY)
+    status_message = mock_display_instructions.call_args.args[1]
+    assert _EXPECTED_URL in status_message
 
 
 def test_get_job_status_endpoint(
-    server_fixture: Server, job_fixture: Job, mocker: Any
+    server_fixture: Server, job_fixture: Job, mock_jobs: Any
 ) -> None:
     """Test the get_job_status endpoint"""
     client = TestClient(server_fixture.app)
 
     # Test success case
-    mock_jobs = mocker.patch("supervaizer.routes.Jobs")
-    mock_jobs_instance = mocker.MagicMock()
-    mock_jobs_instance.get_job.return_value = job_fixture
-    mock_jobs.return_value = mock_jobs_instance
+    mock_jobs.get_job.return_value = job_fixture
 
     # Use the API key from the server fixture
     headers = {"X-API-Key": server_fixture.api_key or ""}
@@ -546,7 +559,7 @@ def test_get_job_status_endpoint(
     assert "API key" in response.json()["detail"]
 
     # Test job not found case with valid API key
-    mock_jobs_instance.get_job.return_value = None
+    mock_jobs.get_job.return_value = None
     response = client.get("/api/supervaizer/jobs/non-existent-job-id", headers=headers)
     assert response.status_code == 404
     assert "detail" in response.json()
@@ -577,6 +590,7 @@ async def test_get_all_jobs_endpoint(
     agent_fixture: Agent,
     job_fixture: Job,
     mocker: Any,
+    mock_jobs: Any,
     monkeypatch: pytest.MonkeyPatch,
     no_response_validation: Any,
     exception: Exception | None,
@@ -589,26 +603,14 @@ async def test_get_all_jobs_endpoint(
         monkeypatch.undo()
 
     if exception:
-        # Mock Jobs() to raise an exception when its attribute is accessed
-        mock_jobs_class = mocker.patch("supervaizer.routes.Jobs")
-        mock_jobs_instance = mocker.MagicMock()
-        # Use a property to raise the exception on access
-        type(mock_jobs_instance).jobs_by_agent = mocker.PropertyMock(
-            side_effect=exception
-        )
-        mock_jobs_class.return_value = mock_jobs_instance
+        # Use a property to raise the exception when jobs_by_agent is accessed
+        type(mock_jobs).jobs_by_agent = mocker.PropertyMock(side_effect=exception)
     else:
-        # For non-exception cases, mock the Jobs registry to return jobs
-        mock_jobs = mocker.patch("supervaizer.routes.Jobs")
-        mock_jobs_instance = mocker.MagicMock()
-        mock_jobs.return_value = mock_jobs_instance
         # If filtering, update the job's status to match
         if status_filter:
             job_fixture.status = status_filter
         # The endpoint iterates over jobs_by_agent, so we mock that attribute
-        mock_jobs_instance.jobs_by_agent = {
-            agent_fixture.name: {job_fixture.id: job_fixture}
-        }
+        mock_jobs.jobs_by_agent = {agent_fixture.name: {job_fixture.id: job_fixture}}
 
     # Add API key headers
     client = TestClient(server_fixture.app)
@@ -696,7 +698,6 @@ async def test_start_job_endpoint(
     agent_fixture: Agent,
     job_fixture: Job,
     context_fixture: JobContext,
-    parameters_fixture: ParametersSetup,
     monkeypatch: pytest.MonkeyPatch,
     no_response_validation: Any,
     mocker: Any,
@@ -725,15 +726,6 @@ async def test_start_job_endpoint(
         new=mock_service_job_start,
     )
 
-    # Patch Server.decrypt to return parameters_fixture as dict
-    mocker.patch(
-        "supervaizer.common.decrypt_value",
-        "decrypt",
-        lambda self, encrypted: json.dumps({
-            k: v.value for k, v in parameters_fixture.definitions.items()
-        }),
-    )
-
     # Set up client with API key
     client = TestClient(server_fixture.app)
     headers: dict[str, Any] = {"X-API-Key": server_fixture.api_key}
@@ -837,6 +829,7 @@ async def test_get_agent_jobs_endpoint(
     agent_fixture: Agent,
     job_fixture: Job,
     mocker: Any,
+    mock_jobs: Any,
     monkeypatch: pytest.MonkeyPatch,
     no_response_validation: Any,
     exception: Exception | None,
@@ -850,24 +843,19 @@ async def test_get_agent_jobs_endpoint(
     if not exception:
         monkeypatch.undo()
 
-    # Create mock jobs
-    mock_jobs = mocker.patch("supervaizer.routes.Jobs")
-    mock_jobs_instance = mocker.MagicMock()
-    mock_jobs.return_value = mock_jobs_instance
-
     # Configure based on test parameters
     if exception:
         # Mock the Jobs registry to raise the exception
-        mock_jobs_instance.get_agent_jobs.side_effect = exception
+        mock_jobs.get_agent_jobs.side_effect = exception
     elif status_filter:
         job_fixture.status = status_filter
         jobs_list = [job_fixture]
-        mock_jobs_instance.get_agent_jobs.return_value = {j.id: j for j in jobs_list}
+        mock_jobs.get_agent_jobs.return_value = {j.id: j for j in jobs_list}
     else:
         # The endpoint iterates over the values of the returned dict.
         # Let's make the mock return a list directly to be clearer.
         jobs_list = [job_fixture]
-        mock_jobs_instance.get_agent_jobs.return_value = {j.id: j for j in jobs_list}
+        mock_jobs.get_agent_jobs.return_value = {j.id: j for j in jobs_list}
 
     # Mock error response for exceptions
     if exception:
@@ -933,6 +921,7 @@ async def test_get_job_status_for_agent(
     agent_fixture: Agent,
     job_fixture: Job,
     mocker: Any,
+    mock_jobs: Any,
     monkeypatch: pytest.MonkeyPatch,
     no_response_validation: Any,
     job_exists: bool,
@@ -947,18 +936,13 @@ async def test_get_job_status_for_agent(
     if not exception and job_exists:
         monkeypatch.undo()
 
-    # Simple mocking approach using existing fixtures
-    mock_jobs = mocker.patch("supervaizer.routes.Jobs")
-    mock_jobs_instance = mocker.MagicMock()
-    mock_jobs.return_value = mock_jobs_instance
-
     # Configure mocks based on test parameters
     if exception:
-        mock_jobs_instance.get_job.side_effect = exception
+        mock_jobs.get_job.side_effect = exception
     elif job_exists:
-        mock_jobs_instance.get_job.return_value = job_fixture
+        mock_jobs.get_job.return_value = job_fixture
     else:
-        mock_jobs_instance.get_job.return_value = None
+        mock_jobs.get_job.return_value = None
 
     # Mock error response creation for error cases
     if exception or not job_exists:
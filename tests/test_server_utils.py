@@ -11,6 +11,7 @@
 # https://mozilla.org/MPL/2.0/.
 
 
+import json
 from datetime import datetime
 
 from cryptography.hazmat.backends import default_backend
@@ -31,6 +32,14 @@ def test_error_type_enum() -> None:
     assert ErrorType.INVALID_PARAMETERS.value == "invalid_parameters"
 
 
+def test_error_type_is_str_enum() -> None:
+    for error_type in ErrorType:
+        assert isinstance(error_type, str)
+        assert error_type == error_type.value
+        # Lookups by raw value resolve to the singleton member
+        assert ErrorType(error_type.value) is error_type
+
+
 def test_error_response_model() -> None:
     error = ErrorResponse(
         error="Test Error",
@@ -60,6 +69,36 @@ def test_create_error_response() -> None:
     assert "job_not_found" in content
 
 
+def test_create_error_response_body_is_json() -> None:
+    response = create_error_response(
+        error_type=ErrorType.AGENT_NOT_FOUND, detail="No agent", status_code=404
+    )
+
+    body = json.loads(response.body)
+    assert body["error"] == "Agent Not Found"
+    assert body["error_type"] == "agent_not_found"
+    assert body["status_code"] == 404
+    assert datetime.fromisoformat(body["timestamp"])
+
+
+def test_create_error_response_titles() -> None:
+    titles = {
+        error_type: json.loads(create_error_response(error_type, "detail", 400).body)[
+            "error"
+        ]
+        for error_type in ErrorType
+    }
+
+    assert titles == {
+        ErrorType.JOB_NOT_FOUND: "Job Not Found",
+        ErrorType.JOB_ALREADY_EXISTS: "Job Already Exists",
+        ErrorType.AGENT_NOT_FOUND: "Agent Not Found",
+        ErrorType.INVALID_REQUEST: "Invalid Request",
+        ErrorType.INTERNAL_ERROR: "Internal Error",
+        ErrorType.INVALID_PARAMETERS: "Invalid Parameters",
+    }
+
+
 def test_create_error_response_without_detail() -> None:
     response = create_error_response(
         error_type=ErrorType.INTERNAL_ERROR,
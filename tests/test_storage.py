@@ -10,8 +10,11 @@
 # If a copy of the MPL was not distributed with this file, you can obtain one at
 # https://mozilla.org/MPL/2.0/.
 
+import json
+import sys
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -29,6 +32,9 @@ from supervaizer.storage import (
     StorageManager,
     create_case_repository,
     create_job_repository,
+    load_running_entities_on_startup,
+    persistent_handle_event,
+    persistent_transition,
 )
 
 
@@ -44,6 +50,16 @@ def _clear_storage_singleton() -> None:
                 cell.cell_contents.clear()
 
 
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    """Poll predicate until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
 class TestPersistenceOptional:
     """Test optional persistence (default off for Vercel/serverless)."""
 
@@ -145,6 +161,20 @@ class TestStorageManager:
         assert retrieved[0] in test_objects
         assert retrieved[1] in test_objects
 
+    def test_iter_objects(self, storage_manager: StorageManager) -> None:
+        """Test iterating objects is stable across concurrent writes."""
+        storage_manager.save_object("TestType", {"id": "test-1"})
+        iterator = storage_manager.iter_objects("TestType")
+        storage_manager.save_object("TestType", {"id": "test-2"})
+
+        # The iterator keeps walking the snapshot it started from
+        assert list(iterator) == [{"id": "test-1"}]
+        assert [o["id"] for o in storage_manager.iter_objects("TestType")] == [
+            "test-1",
+            "test-2",
+        ]
+        assert list(storage_manager.iter_objects("Missing")) == []
+
     def test_get_object_by_id(self, storage_manager: StorageManager) -> None:
         """Test getting a specific object by ID."""
         test_obj = {"id": "test-123", "name": "Test Object"}
@@ -182,15 +212,17 @@ class TestStorageManager:
         storage_manager.save_object("Type2", {"id": "test-2", "name": "Object 2"})
 
         # Verify data exists
-        assert len(storage_manager.get_objects("Type1")) == 1
-        assert len(storage_manager.get_objects("Type2")) == 1
+        assert storage_manager.count("Type1") == 1
+        assert storage_manager.count("Type2") == 1
+        assert storage_manager.is_empty("Type1") is False
 
         # Reset storage
         storage_manager.reset_storage()
 
         # Verify all data is gone
-        assert len(storage_manager.get_objects("Type1")) == 0
-        assert len(storage_manager.get_objects("Type2")) == 0
+        assert storage_manager.count("Type1") == 0
+        assert storage_manager.is_empty("Type2") is True
+        assert storage_manager.get_objects("Type1") == []
 
     def test_get_cases_for_job(self, storage_manager: StorageManager) -> None:
         """Test getting cases for a specific job."""
@@ -211,6 +243,24 @@ class TestStorageManager:
         assert len(job2_cases) == 1
         assert job2_cases[0]["job_id"] == "job-2"
 
+    def test_get_cases_for_job_follows_job_changes(
+        self, storage_manager: StorageManager
+    ) -> None:
+        """Test the job_id index tracks reassigned and deleted cases."""
+        storage_manager.save_object("Case", {"id": "case-1", "job_id": "job-1"})
+        storage_manager.save_object("Case", {"id": "case-2", "job_id": "job-1"})
+        storage_manager.save_object("Case", {"id": "case-1", "job_id": "job-2"})
+
+        assert [c["id"] for c in storage_manager.get_cases_for_job("job-1")] == [
+            "case-2"
+        ]
+        assert [c["id"] for c in storage_manager.get_cases_for_job("job-2")] == [
+            "case-1"
+        ]
+
+        storage_manager.delete_object("Case", "case-2")
+        assert storage_manager.get_cases_for_job("job-1") == []
+
     def test_thread_safety(self, storage_manager: StorageManager) -> None:
         """Test thread safety of operations."""
         results = []
@@ -249,6 +299,257 @@ class TestStorageManager:
         all_objects = storage_manager.get_objects("ThreadTest")
         assert len(all_objects) == 50  # 5 workers * 10 objects each
 
+    def test_save_objects_bulk(self, storage_manager: StorageManager) -> None:
+        """Test bulk saves from concurrent workers, including updates."""
+        storage_manager.save_object("ThreadTest", {"id": "worker-0-0", "old": True})
+
+        def worker(worker_id: int) -> None:
+            storage_manager.save_objects_bulk(
+                "ThreadTest",
+                [
+                    {"id": f"worker-{worker_id}-{i}", "data": f"data-{i}"}
+                    for i in range(10)
+                ],
+            )
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert storage_manager.count("ThreadTest") == 50
+        assert len(storage_manager._db.table("ThreadTest")) == 50
+        assert storage_manager.get_object_by_id("ThreadTest", "worker-0-0") == {
+            "id": "worker-0-0",
+            "old": True,
+            "data": "data-0",
+        }
+
+    def test_snapshot_reads(self, storage_manager: StorageManager) -> None:
+        """Test snapshot reads merge like upsert, return copies and reload from disk."""
+        storage_manager.save_object("TestType", {"id": "obj-1", "name": "A", "n": 1})
+        storage_manager.save_object("TestType", {"id": "obj-1", "name": "B"})
+
+        retrieved = storage_manager.get_object_by_id("TestType", "obj-1")
+        assert retrieved == {"id": "obj-1", "name": "B", "n": 1}
+        assert retrieved is not None
+        retrieved["name"] = "mutated"
+        assert storage_manager.get_objects("TestType")[0]["name"] == "B"
+
+        storage_manager.close()
+        _clear_storage_singleton()
+        reopened = StorageManager(db_path=str(storage_manager.db_path))
+        assert reopened.get_object_by_id("TestType", "obj-1") == {
+            "id": "obj-1",
+            "name": "B",
+            "n": 1,
+        }
+        # Type names loaded from the file are interned snapshot keys
+        key = next(k for k in reopened._snapshot if k == "TestType")
+        assert key is sys.intern("TestType")
+        # Writes after a reload address the documents loaded from disk
+        reopened.save_object("TestType", {"id": "obj-1", "n": 2})
+        assert len(reopened._db.table("TestType")) == 1
+        assert reopened.delete_object("TestType", "obj-1") is True
+        assert reopened.delete_object("TestType", "obj-1") is False
+        assert len(reopened._db.table("TestType")) == 0
+        reopened.close()
+
+    def test_documents_without_id_are_skipped_on_load(self, tmp_path: Path) -> None:
+        """Test stored documents lacking an id do not break startup."""
+        db_file = tmp_path / "entities.json"
+        db_file.write_text(
+            json.dumps({
+                "TestType": {"1": {"name": "orphan"}, "2": {"id": "obj-1", "n": 1}}
+            })
+        )
+        _clear_storage_singleton()
+        try:
+            storage = StorageManager(db_path=str(db_file))
+            assert storage.get_objects("TestType") == [{"id": "obj-1", "n": 1}]
+            storage.save_object("TestType", {"id": "obj-1", "n": 2})
+            assert len(storage._db.table("TestType")) == 2
+            storage.close()
+        finally:
+            _clear_storage_singleton()
+
+    def test_snapshot_keys_are_interned_once(
+        self, storage_manager: StorageManager
+    ) -> None:
+        """Test every writer keeps the interned type name as the snapshot key."""
+        interned = sys.intern("DynamicType")
+
+        def type_name(prefix: str = "Dynamic") -> str:
+            # Built at runtime, so equal to but not identical with the literal
+            return f"{prefix}Type"
+
+        storage_manager.save_object_async(type_name(), {"id": "obj-1"})
+        storage_manager.save_objects_bulk(type_name(), [{"id": "obj-2"}])
+        storage_manager.save_object(type_name(), {"id": "obj-3"})
+        assert storage_manager.delete_object(type_name(), "obj-1") is True
+
+        keys = [k for k in storage_manager._snapshot if k == "DynamicType"]
+        assert len(keys) == 1
+        assert keys[0] is interned
+
+    def test_save_object_async(self, storage_manager: StorageManager) -> None:
+        """Test async saves are readable at once and coalesce on flush."""
+        storage_manager.save_object_async("TestType", {"id": "obj-1", "n": 1})
+        storage_manager.save_object_async("TestType", {"id": "obj-1", "n": 2})
+        storage_manager.save_object_async("TestType", {"id": "obj-2", "n": 1})
+        assert storage_manager.get_object_by_id("TestType", "obj-1") == {
+            "id": "obj-1",
+            "n": 2,
+        }
+
+        # Deleting before the write lands still reports the object as deleted
+        assert storage_manager.delete_object("TestType", "obj-2") is True
+
+        storage_manager.flush()
+        table = storage_manager._db.table("TestType")
+        assert [dict(doc) for doc in table.all()] == [{"id": "obj-1", "n": 2}]
+
+    def test_save_object_async_writer_drains_queue(
+        self, storage_manager: StorageManager
+    ) -> None:
+        """Test the background writer persists async saves without a flush."""
+        storage_manager.save_object_async("TestType", {"id": "obj-1", "n": 1})
+
+        table = storage_manager._db.table("TestType")
+        assert _wait_for(lambda: len(table) == 1)
+        assert [dict(doc) for doc in table.all()] == [{"id": "obj-1", "n": 1}]
+        assert not storage_manager._pending
+
+    def test_save_object_async_survives_failed_write(
+        self,
+        storage_manager: StorageManager,
+        mocker: MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a failed write is retried and does not lose later saves."""
+        monkeypatch.setattr(storage_module, "_WRITE_RETRY_DELAY", 0.01)
+        write_documents = storage_manager._write_documents
+        calls = 0
+
+        def fail_first_write(type: str, documents: dict[str, Any]) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise OSError("disk full")
+            write_documents(type, documents)
+
+        mocker.patch.object(
+            storage_manager, "_write_documents", side_effect=fail_first_write
+        )
+
+        storage_manager.save_object_async("TestType", {"id": "obj-1", "n": 1})
+        assert _wait_for(lambda: calls >= 1)
+        storage_manager.save_object_async("TestType", {"id": "obj-2", "n": 1})
+
+        table = storage_manager._db.table("TestType")
+        assert _wait_for(lambda: len(table) == 2)
+        assert {doc["id"] for doc in table.all()} == {"obj-1", "obj-2"}
+        assert storage_manager._writer is not None
+        assert storage_manager._writer.is_alive()
+
+    def test_flush_writes_batch_once_per_type(
+        self, storage_manager: StorageManager, mocker: MockerFixture
+    ) -> None:
+        """Test a drained batch costs one storage write per type, not per object."""
+        storage_manager.save_object("TestType", {"id": "obj-1", "n": 1})
+        storage_manager.save_object("TestType", {"id": "obj-2", "n": 1})
+        write = mocker.spy(storage_manager._db.storage, "write")
+
+        with storage_manager._flush_lock:
+            # Hold off the background writer so the whole burst is one batch
+            for n in range(3):
+                storage_manager.save_object_async(
+                    "TestType", {"id": f"obj-{n}", "n": 2}
+                )
+        storage_manager.flush()
+
+        # One write updates obj-1 and obj-2, another inserts obj-0
+        assert write.call_count == 2
+        table = storage_manager._db.table("TestType")
+        assert sorted((doc["id"], doc["n"]) for doc in table.all()) == [
+            ("obj-0", 2),
+            ("obj-1", 2),
+            ("obj-2", 2),
+        ]
+
+    def test_flush_drops_unserializable_document(
+        self, storage_manager: StorageManager
+    ) -> None:
+        """Test a document that cannot be encoded is dropped, not retried."""
+        with storage_manager._flush_lock:
+            storage_manager.save_object_async("TestType", {"id": "obj-1", "n": 1})
+            storage_manager.save_object_async("TestType", {"id": "bad", "n": {1, 2}})
+        storage_manager.flush()
+
+        assert not storage_manager._pending
+        table = storage_manager._db.table("TestType")
+        assert [dict(doc) for doc in table.all()] == [{"id": "obj-1", "n": 1}]
+
+    def test_save_object_async_after_close(
+        self, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test async saves after close() write through instead of queueing."""
+        monkeypatch.setattr(storage_module, "PERSISTENCE_ENABLED", False)
+        _clear_storage_singleton()
+        storage = StorageManager()
+        unregister = mocker.spy(storage_module.atexit, "unregister")
+        try:
+            storage.save_object_async("TestType", {"id": "obj-1"})
+            storage.close()
+            unregister.assert_called_once_with(storage.flush)
+
+            storage.save_object_async("TestType", {"id": "obj-2"})
+            assert not storage._pending
+            table = storage._db.table("TestType")
+            assert {doc["id"] for doc in table.all()} == {"obj-1", "obj-2"}
+        finally:
+            _clear_storage_singleton()
+
+    def test_file_format(self, storage_manager: StorageManager) -> None:
+        """Test the db file stays sorted, indented JSON."""
+        storage_manager.save_object("TestType", {"id": "obj-1", "b": 1, "a": "é"})
+
+        content = storage_manager.db_path.read_text(encoding="utf-8")
+        assert json.loads(content) == {
+            "TestType": {"1": {"a": "é", "b": 1, "id": "obj-1"}}
+        }
+        assert '\n  "TestType": {\n' in content
+
+    def test_lock_stripes_per_type(self, storage_manager: StorageManager) -> None:
+        """Test each type maps to a stable stripe and reset takes every stripe."""
+        assert storage_manager._lock_for("Job") is storage_manager._lock_for("Job")
+        assert storage_manager._lock_for("Case") in storage_manager._locks
+
+        # Stripes are re-entrant: a nested same-type call must not deadlock.
+        with storage_manager._lock_for("Job"):
+            storage_manager.save_object("Job", {"id": "job-1"})
+            storage_manager.reset_storage()
+        assert storage_manager.get_objects("Job") == []
+
+    def test_publish_does_not_wait_for_db_lock(
+        self, storage_manager: StorageManager
+    ) -> None:
+        """Test snapshot publication only takes the type's stripe, not _lock."""
+        done = threading.Event()
+
+        def save() -> None:
+            storage_manager.save_object_async("Job", {"id": "job-1"})
+            done.set()
+
+        # While TinyDB I/O holds _lock, an async save still publishes at once
+        with storage_manager._lock:
+            thread = threading.Thread(target=save)
+            thread.start()
+            assert done.wait(timeout=5)
+            assert storage_manager.get_object_by_id("Job", "job-1") == {"id": "job-1"}
+        thread.join()
+
 
 class TestEntityRepository:
     """Test the EntityRepository class."""
@@ -374,6 +675,11 @@ class TestPersistentEntityLifecycle:
         stored = storage_manager.get_object_by_id("MockEntity", "test-entity-123")
         assert stored is not None
 
+    def test_class_forwards_to_functions(self) -> None:
+        """Test the class methods are the module-level persistence functions."""
+        assert PersistentEntityLifecycle.transition is persistent_transition
+        assert PersistentEntityLifecycle.handle_event is persistent_handle_event
+
     def test_persistent_transition_failure(
         self,
         mocker: MockerFixture,
@@ -417,13 +723,8 @@ class TestIntegrationWithActualEntities:
 
     def _clear_singletons(self) -> None:
         """Helper to properly clear singleton instances."""
-        # Clear Jobs singleton
-        jobs = Jobs()
-        jobs.jobs_by_agent = {}
-
-        # Clear Cases singleton
-        cases = Cases()
-        cases.cases_by_job = {}
+        Jobs().reset()
+        Cases().reset()
 
     def test_job_persistence(
         self, storage_manager: StorageManager, test_job_context: JobContext
@@ -524,3 +825,27 @@ class TestIntegrationWithActualEntities:
         job_cases = storage_manager.get_cases_for_job("test-job-123")
         assert len(job_cases) == 1
         assert job_cases[0]["id"] == "test-case-123"
+
+    def test_loaded_running_job_does_not_share_snapshot(
+        self, storage_manager: StorageManager, test_job_context: JobContext
+    ) -> None:
+        """Test jobs loaded at startup do not modify the stored documents."""
+        self._clear_singletons()
+        job = Job(
+            id="test-job-123",
+            name="Test Job",
+            agent_name="test-agent",
+            status=EntityStatus.IN_PROGRESS,
+            job_context=test_job_context,
+        )
+        storage_manager.save_object("Job", job.to_dict)
+        self._clear_singletons()
+
+        load_running_entities_on_startup()
+        loaded = Jobs().get_job("test-job-123")
+        assert loaded is not None
+        loaded.case_ids.append("test-case-123")
+
+        stored = storage_manager.get_object_by_id("Job", "test-job-123")
+        assert stored is not None
+        assert stored["case_ids"] == []
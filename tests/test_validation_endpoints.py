@@ -10,347 +10,437 @@
 # If a copy of the MPL was not distributed with this file, you can obtain one at
 # https://mozilla.org/MPL/2.0/.
 
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
-from fastapi import Header
-from fastapi.testclient import TestClient
+import pytest_asyncio
+import shortuuid
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from fastapi import FastAPI, Header
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
 
 from supervaizer.agent import Agent, AgentMethod, AgentMethodField, AgentMethods
+from supervaizer.common import encrypt_value
 from supervaizer.parameter import Parameter, ParametersSetup
 from supervaizer.routes import create_agent_route
-from supervaizer.server import Server
 
+PARAMETERS_URL = "/test-agent/agents/test-agent/validate-agent-parameters"
+METHOD_FIELDS_URL = "/test-agent/agents/test-agent/validate-method-fields"
+# Request bodies are encoded once at import; tests post the bytes as-is.
+HEADERS = {"X-API-Key": "test-api-key", "Content-Type": "application/json"}
+PAYLOAD_PLAIN = orjson.dumps({"test": "data"})
+PAYLOAD_ENCRYPTED = orjson.dumps({"encrypted_agent_parameters": "encrypted_string"})
 
-@pytest.fixture
-def mock_server():
-    """Create a mock server for testing."""
-    server = MagicMock(spec=Server)
-    server.private_key = "test_private_key"
-    server.api_key = (
-        "test-api-key"  # <-- ADDED: used by require_api_key live-server fallback
+
+def _verify_api_key(api_key: str = Header(alias="X-API-Key")) -> str:
+    """API key dependency with a stable identity across tests."""
+    return api_key
+
+
+@dataclass
+class _ServerStub:
+    """The slice of Server the agent routes and the API key check read."""
+
+    private_key: str = "test_private_key"
+    # Used by require_api_key's live-server fallback.
+    api_key: str = "test-api-key"
+    agents: list[Agent] = field(default_factory=list)
+    encrypt: MagicMock = field(
+        default_factory=lambda: MagicMock(return_value="encrypted_string")
     )
+    public_key: SimpleNamespace = field(
+        default_factory=lambda: SimpleNamespace(
+            public_bytes=lambda *_: b"public_key_bytes"
+        )
+    )
+    verify_api_key: Callable[..., str] = field(default=_verify_api_key)
 
-    # Create a proper dependency function for verify_api_key
-    def verify_api_key(api_key: str = Header(alias="X-API-Key")):
-        return api_key
 
-    server.verify_api_key = verify_api_key
-    server.agents = []  # Empty agents list
-    server.encrypt = MagicMock(return_value="encrypted_string")
-    server.public_key = MagicMock()
-    server.public_key.public_bytes = MagicMock(return_value=b"public_key_bytes")
-    return server
+@pytest.fixture(scope="module")
+def mock_server() -> _ServerStub:
+    """Create a server stub shared by every test in the module."""
+    return _ServerStub()
 
 
-@pytest.fixture
-def test_agent():
-    """Create a test agent with validation methods."""
-    # Create parameters setup
-    parameters_setup = ParametersSetup.from_list([
-        Parameter(name="API_KEY", value="test_key", is_required=True),
-        Parameter(name="MAX_RETRIES", value="3", is_required=False),
-        Parameter(name="TIMEOUT", value="30", is_required=True),
-    ])
+@pytest.fixture(autouse=True)
+def reset_mock_server(mock_server: _ServerStub) -> None:
+    """Clear call history on the shared mock server between tests."""
+    mock_server.encrypt.reset_mock()
+
+
+def _construct[M: BaseModel](cls: type[M], **fields: Any) -> M:
+    """Build ``cls`` from known-good test data without running validators."""
+    return cls.model_construct(**fields)
 
+
+def _test_agent_fields(parameters_setup: ParametersSetup | None) -> dict[str, Any]:
+    """Keyword arguments for the validation test agent, sub-models included."""
     # Create method with fields
-    job_start_method = AgentMethod(
+    job_start_method = _construct(
+        AgentMethod,
         name="start",
         method="test.start",
         fields=[
-            AgentMethodField(name="company_name", type=str, required=True),
-            AgentMethodField(name="max_results", type=int, required=True),
-            AgentMethodField(name="subscribe_updates", type=bool, required=False),
+            _construct(AgentMethodField, name="company_name", type=str, required=True),
+            _construct(AgentMethodField, name="max_results", type=int, required=True),
+            _construct(
+                AgentMethodField, name="subscribe_updates", type=bool, required=False
+            ),
         ],
         description="Start a test job",
     )
 
     # Create custom method
-    custom_method = AgentMethod(
+    custom_method = _construct(
+        AgentMethod,
         name="custom-action",
         method="test.custom",
         fields=[
-            AgentMethodField(name="action_type", type=str, required=True),
-            AgentMethodField(name="priority", type=int, required=False),
+            _construct(AgentMethodField, name="action_type", type=str, required=True),
+            _construct(AgentMethodField, name="priority", type=int, required=False),
         ],
         description="Custom test action",
     )
 
-    # Create agent
-    agent = Agent(
-        name="test_agent",
-        author="Test Author",
-        developer="Test Developer",
-        maintainer="Test Maintainer",
-        editor="Test Editor",
-        version="1.0.0",
-        description="Test agent for validation",
-        tags=["test", "validation"],
-        methods=AgentMethods(
+    return {
+        "name": "test_agent",
+        "author": "Test Author",
+        "developer": "Test Developer",
+        "maintainer": "Test Maintainer",
+        "editor": "Test Editor",
+        "version": "1.0.0",
+        "description": "Test agent for validation",
+        "tags": ["test", "validation"],
+        "methods": _construct(
+            AgentMethods,
             job_start=job_start_method,
-            job_stop=AgentMethod(name="stop", method="test.stop"),
-            job_status=AgentMethod(name="status", method="test.status"),
+            job_stop=_construct(AgentMethod, name="stop", method="test.stop"),
+            job_status=_construct(AgentMethod, name="status", method="test.status"),
             chat=None,
             custom={"custom-action": custom_method},
         ),
-        parameters_setup=parameters_setup,
+        "parameters_setup": parameters_setup,
+    }
+
+
+def _test_parameters_setup() -> ParametersSetup:
+    """Parameter setup with two required parameters and one optional one."""
+    return _construct(
+        ParametersSetup,
+        definitions={
+            parameter.name: parameter
+            for parameter in (
+                _construct(
+                    Parameter, name="API_KEY", value="test_key", is_required=True
+                ),
+                _construct(Parameter, name="MAX_RETRIES", value="3", is_required=False),
+                _construct(Parameter, name="TIMEOUT", value="30", is_required=True),
+            )
+        },
     )
 
-    return agent
 
+def _build_test_agent(parameters_setup: ParametersSetup | None) -> Agent:
+    """Build the validation test agent with the given parameter setup."""
+    fields = _test_agent_fields(parameters_setup)
+    # Agent derives its id from the name in __init__, which model_construct skips.
+    return _construct(Agent, id=shortuuid.uuid(name=fields["name"]), **fields)
 
-@pytest.fixture
-def test_client(mock_server, test_agent):
-    """Create a test client with the validation endpoints."""
-    router = create_agent_route(mock_server, test_agent)
 
-    # Create a minimal FastAPI app for testing
-    from fastapi import FastAPI
+def _build_test_client(server: _ServerStub, agent: Agent) -> AsyncClient:
+    """Mount the agent routes on a minimal FastAPI app and wrap it in a client.
+
+    The client talks to the app through ``ASGITransport`` on the module's event
+    loop, so requests skip the thread portal ``TestClient`` spins up per call.
+    """
+    router = create_agent_route(server, agent)  # type: ignore[arg-type]
 
     app = FastAPI()
-    app.state.server = (
-        mock_server  # <-- ADDED: enables require_api_key live-server fallback
-    )
+    app.state.server = server  # <-- ADDED: enables require_api_key live-server fallback
     # Mount the router at the agent path
     app.include_router(router, prefix="/test-agent")
 
-    return TestClient(app)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
 
-class TestValidateAgentParameters:
-    """Test the /validate-agent-parameters endpoint."""
+@pytest.fixture(scope="module")
+def test_agent() -> Agent:
+    """Create a test agent with validation methods."""
+    return _build_test_agent(_test_parameters_setup())
 
-    def test_validate_agent_parameters_no_setup(
-        self, test_client, mock_server, test_agent
-    ):
-        """Test validation when agent has no parameter setup."""
-        test_agent.parameters_setup = None
 
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-agent-parameters",
-            json={"test": "data"},
-            headers={"X-API-Key": "test-api-key"},
-        )
+@pytest.fixture(scope="module")
+def test_agent_no_params() -> Agent:
+    """Create a test agent without a parameter setup."""
+    return _build_test_agent(None)
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is True
-        assert data["message"] == "Agent has no parameter setup defined"
 
-    def test_validate_agent_parameters_no_encrypted_params(self, test_client):
-        """Test validation with no encrypted parameters."""
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-agent-parameters",
-            json={"test": "data"},
-            headers={"X-API-Key": "test-api-key"},
-        )
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def test_client(
+    mock_server: _ServerStub, test_agent: Agent
+) -> AsyncIterator[AsyncClient]:
+    """Create a test client with the validation endpoints."""
+    async with _build_test_client(mock_server, test_agent) as client:
+        yield client
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert data["message"] == "Agent parameter validation failed"
-        assert "API_KEY" in data["invalid_parameters"]
-        assert "TIMEOUT" in data["invalid_parameters"]
 
-    @patch("supervaizer.common.decrypt_value")
-    def test_validate_agent_parameters_valid_params(self, mock_decrypt, test_client):
-        """Test validation with valid encrypted parameters."""
-        mock_decrypt.return_value = '{"API_KEY": "new_key", "TIMEOUT": "60"}'
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def test_client_no_params(
+    mock_server: _ServerStub, test_agent_no_params: Agent
+) -> AsyncIterator[AsyncClient]:
+    """Create a test client for the agent without a parameter setup."""
+    async with _build_test_client(mock_server, test_agent_no_params) as client:
+        yield client
 
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-agent-parameters",
-            json={"encrypted_agent_parameters": "encrypted_string"},
-            headers={"X-API-Key": "test-api-key"},
-        )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is True
-        assert data["message"] == "Agent parameters validated successfully"
+@pytest.fixture
+def decrypted_parameters(request: pytest.FixtureRequest) -> Iterator[MagicMock]:
+    """Patch decrypt_value to return ``request.param``, or raise it if an exception."""
+    with patch("supervaizer.routes.decrypt_value") as mock_decrypt:
+        if isinstance(request.param, Exception):
+            mock_decrypt.side_effect = request.param
+        else:
+            mock_decrypt.return_value = request.param
+        yield mock_decrypt
 
-    @patch("supervaizer.common.decrypt_value")
-    def test_validate_agent_parameters_missing_required(
-        self, mock_decrypt, test_client
-    ):
-        """Test validation with missing required parameters."""
-        mock_decrypt.return_value = '{"MAX_RETRIES": "5"}'
-
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-agent-parameters",
-            json={"encrypted_agent_parameters": "encrypted_string"},
-            headers={"X-API-Key": "test-api-key"},
-        )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert data["message"] == "Agent parameter validation failed"
-        assert "API_KEY" in data["invalid_parameters"]
-        assert "TIMEOUT" in data["invalid_parameters"]
-
-    @patch("supervaizer.common.decrypt_value")
-    def test_validate_agent_parameters_decryption_failure(
-        self, mock_decrypt, test_client
-    ):
-        """Test validation when decryption fails."""
-        mock_decrypt.side_effect = Exception("Decryption failed")
-
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-agent-parameters",
-            json={"encrypted_agent_parameters": "encrypted_string"},
-            headers={"X-API-Key": "test-api-key"},
-        )
+def test_agent_validates_on_construct(test_agent: Agent) -> None:
+    """The fixture data, built without validation, passes the validating constructor."""
+    validated = Agent(**test_agent.model_dump())
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert "Decryption failed" in data["message"]
-        assert "encrypted_agent_parameters" in data["invalid_parameters"]
+    assert isinstance(validated.methods, AgentMethods)
+    assert isinstance(validated.parameters_setup, ParametersSetup)
+    assert validated.model_dump() == test_agent.model_dump()
 
 
-class TestValidateMethodFields:
-    """Test the /validate-method-fields endpoint."""
+@pytest.mark.asyncio(loop_scope="module")
+class TestValidateAgentParameters:
+    """Test the /validate-agent-parameters endpoint."""
 
-    def test_validate_method_fields_job_start(self, test_client):
-        """Test validation of job_start method fields."""
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-method-fields",
-            json={
-                "method_name": "job_start",
-                "job_fields": {"company_name": "Test Company", "max_results": 10},
-            },
-            headers={"X-API-Key": "test-api-key"},
+    async def test_validate_agent_parameters_no_setup(
+        self, test_client_no_params: AsyncClient
+    ) -> None:
+        """Test validation when agent has no parameter setup."""
+        response = await test_client_no_params.post(
+            PARAMETERS_URL, content=PAYLOAD_PLAIN, headers=HEADERS
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["valid"] is True
-        assert data["message"] == "Method fields validated successfully"
-
-    def test_validate_method_fields_custom_method(self, test_client):
-        """Test validation of custom method fields."""
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-method-fields",
-            json={
-                "method_name": "custom-action",
-                "job_fields": {"action_type": "process", "priority": 1},
-            },
-            headers={"X-API-Key": "test-api-key"},
-        )
+        assert data["message"] == "Agent has no parameter setup defined"
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is True
-        assert data["message"] == "Method fields validated successfully"
-
-    def test_validate_method_fields_method_not_found(self, test_client):
-        """Test validation when method is not found."""
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-method-fields",
-            json={"method_name": "nonexistent_method", "job_fields": {}},
-            headers={"X-API-Key": "test-api-key"},
+    async def test_validate_agent_parameters_no_encrypted_params(
+        self, test_client: AsyncClient
+    ) -> None:
+        """Test validation with no encrypted parameters."""
+        response = await test_client.post(
+            PARAMETERS_URL, content=PAYLOAD_PLAIN, headers=HEADERS
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["valid"] is False
-        assert "not found" in data["message"]
-
-    def test_validate_method_fields_missing_required(self, test_client):
-        """Test validation with missing required fields."""
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-method-fields",
-            json={
-                "method_name": "job_start",
-                "job_fields": {
-                    "max_results": 10
-                    # company_name is missing
-                },
-            },
-            headers={"X-API-Key": "test-api-key"},
-        )
+        assert data["message"] == "Agent parameter validation failed"
+        assert "API_KEY" in data["invalid_parameters"]
+        assert "TIMEOUT" in data["invalid_parameters"]
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert data["message"] == "Method field validation failed"
-        assert "company_name" in data["invalid_fields"]
-        assert "is missing" in data["invalid_fields"]["company_name"]
-
-    def test_validate_method_fields_invalid_types(self, test_client):
-        """Test validation with invalid field types."""
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-method-fields",
-            json={
-                "method_name": "job_start",
-                "job_fields": {
-                    "company_name": 123,  # Should be string
-                    "max_results": "not_a_number",  # Should be int
-                },
-            },
-            headers={"X-API-Key": "test-api-key"},
+    @pytest.mark.parametrize(
+        ("decrypted_parameters", "valid", "message", "invalid_parameters"),
+        [
+            pytest.param(
+                '{"API_KEY": "new_key", "TIMEOUT": "60"}',
+                True,
+                "Agent parameters validated successfully",
+                (),
+                id="valid_params",
+            ),
+            pytest.param(
+                '{"MAX_RETRIES": "5"}',
+                False,
+                "Agent parameter validation failed",
+                ("API_KEY", "TIMEOUT"),
+                id="missing_required",
+            ),
+            pytest.param(
+                Exception("Decryption failed"),
+                False,
+                "Failed to decrypt agent parameters: Decryption failed",
+                ("encrypted_agent_parameters",),
+                id="decryption_failure",
+            ),
+        ],
+        indirect=["decrypted_parameters"],
+    )
+    async def test_validate_agent_parameters_encrypted(
+        self,
+        test_client: AsyncClient,
+        decrypted_parameters: MagicMock,
+        valid: bool,
+        message: str,
+        invalid_parameters: tuple[str, ...],
+    ) -> None:
+        """Test validation of encrypted parameters against the decrypted outcome."""
+        response = await test_client.post(
+            PARAMETERS_URL, content=PAYLOAD_ENCRYPTED, headers=HEADERS
         )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert data["message"] == "Method field validation failed"
-        assert "company_name" in data["invalid_fields"]
-        assert "max_results" in data["invalid_fields"]
-        assert "must be a string" in data["invalid_fields"]["company_name"]
-        assert "must be an integer" in data["invalid_fields"]["max_results"]
-
-    def test_validate_method_fields_unknown_field(self, test_client):
-        """Test validation with unknown field."""
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-method-fields",
-            json={
-                "method_name": "job_start",
-                "job_fields": {
-                    "company_name": "Test Company",
-                    "max_results": 10,
-                    "unknown_field": "should_fail",
-                },
-            },
-            headers={"X-API-Key": "test-api-key"},
+        data = orjson.loads(response.content)
+        assert data["valid"] is valid
+        assert data["message"] == message
+        for name in invalid_parameters:
+            assert name in data["invalid_parameters"]
+        decrypted_parameters.assert_called_once_with(
+            "encrypted_string", "test_private_key"
         )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert data["message"] == "Method field validation failed"
-        assert "unknown_field" in data["invalid_fields"]
-        assert "Unknown field" in data["invalid_fields"]["unknown_field"]
-
-    def test_validate_method_fields_none_values(self, test_client):
-        """Test validation with None values for optional fields."""
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-method-fields",
-            json={
-                "method_name": "job_start",
-                "job_fields": {
-                    "company_name": "Test Company",
-                    "max_results": 10,
-                    "subscribe_updates": None,
-                },
-            },
-            headers={"X-API-Key": "test-api-key"},
+    async def test_validate_agent_parameters_decrypts_real_payload(
+        self, test_agent: Agent, rsa_private_key_fixture: RSAPrivateKey
+    ) -> None:
+        """Test encrypted parameters go through the real decrypt_value."""
+        server = _ServerStub(private_key=rsa_private_key_fixture)  # type: ignore[arg-type]
+        encrypted = encrypt_value(
+            '{"API_KEY": "new_key", "TIMEOUT": "60"}',
+            rsa_private_key_fixture.public_key(),
         )
 
+        async with _build_test_client(server, test_agent) as client:
+            response = await client.post(
+                PARAMETERS_URL,
+                content=orjson.dumps({"encrypted_agent_parameters": encrypted}),
+                headers=HEADERS,
+            )
+
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["valid"] is True
-        assert data["message"] == "Method fields validated successfully"
-
-    def test_validate_method_fields_default_method_name(self, test_client):
-        """Test validation with default method name (job_start)."""
-        response = test_client.post(
-            "/test-agent/agents/test-agent/validate-method-fields",
-            json={"job_fields": {"company_name": "Test Company", "max_results": 10}},
-            headers={"X-API-Key": "test-api-key"},
+        assert data["message"] == "Agent parameters validated successfully"
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestValidateMethodFields:
+    """Test the /validate-method-fields endpoint."""
+
+    @pytest.mark.parametrize(
+        ("payload", "valid", "message", "invalid_fields"),
+        [
+            pytest.param(
+                orjson.dumps({
+                    "method_name": "job_start",
+                    "job_fields": {"company_name": "Test Company", "max_results": 10},
+                }),
+                True,
+                "Method fields validated successfully",
+                {},
+                id="job_start",
+            ),
+            pytest.param(
+                orjson.dumps({
+                    "method_name": "custom-action",
+                    "job_fields": {"action_type": "process", "priority": 1},
+                }),
+                True,
+                "Method fields validated successfully",
+                {},
+                id="custom_method",
+            ),
+            pytest.param(
+                orjson.dumps({"method_name": "nonexistent_method", "job_fields": {}}),
+                False,
+                "Method 'nonexistent_method' not found",
+                {},
+                id="method_not_found",
+            ),
+            pytest.param(
+                # company_name is missing
+                orjson.dumps({
+                    "method_name": "job_start",
+                    "job_fields": {"max_results": 10},
+                }),
+                False,
+                "Method field validation failed",
+                {"company_name": "is missing"},
+                id="missing_required",
+            ),
+            pytest.param(
+                orjson.dumps({
+                    "method_name": "job_start",
+                    "job_fields": {
+                        "company_name": 123,  # Should be string
+                        "max_results": "not_a_number",  # Should be int
+                    },
+                }),
+                False,
+                "Method field validation failed",
+                {
+                    "company_name": "must be a string",
+                    "max_results": "must be an integer",
+                },
+                id="invalid_types",
+            ),
+            pytest.param(
+                orjson.dumps({
+                    "method_name": "job_start",
+                    "job_fields": {
+                        "company_name": "Test Company",
+                        "max_results": 10,
+                        "unknown_field": "should_fail",
+                    },
+                }),
+                False,
+                "Method field validation failed",
+                {"unknown_field": "Unknown field"},
+                id="unknown_field",
+            ),
+            pytest.param(
+                orjson.dumps({
+                    "method_name": "job_start",
+                    "job_fields": {
+                        "company_name": "Test Company",
+                        "max_results": 10,
+                        "subscribe_updates": None,
+                    },
+                }),
+                True,
+                "Method fields validated successfully",
+                {},
+                id="none_values",
+            ),
+            pytest.param(
+                # method_name defaults to job_start
+                orjson.dumps({
+                    "job_fields": {"company_name": "Test Company", "max_results": 10}
+                }),
+                True,
+                "Method fields validated successfully",
+                {},
+                id="default_method_name",
+            ),
+        ],
+    )
+    async def test_validate_method_fields(
+        self,
+        test_client: AsyncClient,
+        payload: bytes,
+        valid: bool,
+        message: str,
+        invalid_fields: dict[str, str],
+    ) -> None:
+        """Test validation of method fields for each payload shape."""
+        response = await test_client.post(
+            METHOD_FIELDS_URL, content=payload, headers=HEADERS
         )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is True
-        assert data["message"] == "Method fields validated successfully"
+        data = orjson.loads(response.content)
+        assert data["valid"] is valid
+        assert data["message"] == message
+        for name, fragment in invalid_fields.items():
+            assert fragment in data["invalid_fields"][name]
@@ -10,17 +10,48 @@
 # If a copy of the MPL was not distributed with this file, you can obtain one at
 # https://mozilla.org/MPL/2.0/.
 
-# export_openapi.py  <-- NEW
-import json
+"""Export the controller template's OpenAPI spec (default: docs/api/openapi.json)."""
+
+import argparse
 import pathlib
 
-from supervaizer.examples.controller_template import sv_server
+import orjson
+
+DEFAULT_OUTPUT = pathlib.Path("docs/api/openapi.json")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__)
+    p.add_argument(
+        "--server-url",
+        help="Advertise this base URL in the spec's servers list",
+    )
+    p.add_argument(
+        "--output",
+        type=pathlib.Path,
+        default=DEFAULT_OUTPUT,
+        help=f"Where to write the spec (default: {DEFAULT_OUTPUT})",
+    )
+    args = p.parse_args()
+
+    # Importing the template builds a full Server; defer it so importing this
+    # module (e.g. during test discovery) stays cheap.
+    from supervaizer.examples.controller_template import sv_server
+
+    app = sv_server.app
+    app.title = "Supervaize API"
+    if args.server_url:
+        app.servers = [{"url": args.server_url}]
+    # Drop any schema cached before the metadata tweaks above.
+    app.openapi_schema = None
+
+    spec = orjson.dumps(app.openapi(), option=orjson.OPT_INDENT_2)
+    output: pathlib.Path = args.output
+    # Leave an unchanged export untouched so repeated runs do not rewrite the file.
+    if not output.is_file() or output.read_bytes() != spec:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_bytes(spec)
 
-app = sv_server.app
-# OPTIONAL: tweak metadata/servers before export
-app.title = "Supervaize API"  # <- change
-# app.servers = [{"url": "https://app.supervaize.com"}]  # <- change
 
-spec = app.openapi()
-pathlib.Path("docs/api").mkdir(parents=True, exist_ok=True)
-pathlib.Path("docs/api/openapi.json").write_text(json.dumps(spec, indent=2))
+if __name__ == "__main__":
+    main()
@@ -51,22 +51,31 @@ from __future__ import annotations
 import dataclasses
 import importlib
 import inspect
-import json
 import os
 import pkgutil
 import re
 import shutil
 import sys
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import starmap
+from operator import itemgetter
 from pathlib import Path
-from types import ModuleType
-from typing import Any, Union
+from stat import S_ISDIR
+from types import ModuleType, NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
 
+import orjson
 from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
 from rich import print
 
 PACKAGE = "supervaizer"
+PACKAGE_PREFIX = f"{PACKAGE}."
 LOCAL_DOCS = Path("./docs")
 LOCAL_MODEL_DOCS = LOCAL_DOCS / "model_reference"
 
@@ -105,132 +114,189 @@ print(f"EXTERNAL_DOC_PATH: {EXTERNAL_DOC_PATH}")
 print(f"EXTERNAL_REF_PATH: {EXTERNAL_REF_PATH}")
 
 
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[-\s]+")
+
+
 def generate_slug(text: str) -> str:
     """Generate a URL-friendly slug from heading text."""
     # Convert to lowercase and replace spaces/hyphens with hyphens
-    slug = re.sub(r"[^\w\s-]", "", text.lower())
-    slug = re.sub(r"[-\s]+", "-", slug)
+    slug = _SLUG_STRIP.sub("", text.lower())
+    slug = _SLUG_DASH.sub("-", slug)
     return slug.strip("-")
 
 
-def format_json_in_doc(doc: str) -> str:
-    """Format JSON content in documentation with proper JSON code blocks."""
-    lines = doc.split("\n")
-    result = []
-    in_json_block = False
-    json_lines_raw: list[str] = []
-    brace_count = 0
-    bracket_count = 0
+# A double-quoted string (with escapes) or a single bracket character. Strings
+# are matched so that brackets inside them, e.g. "{", are not counted.
+_BRACKET_TOKENS = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+
+
+def bracket_deltas(line: str) -> tuple[int, int]:
+    """Return the net change in (brace, bracket) depth across a line."""
+    # One regex scan over the line; only strings and brackets reach Python.
+    brace = bracket = 0
+    for token in _BRACKET_TOKENS.findall(line):
+        if token == "{":
+            brace += 1
+        elif token == "}":
+            brace -= 1
+        elif token == "[":
+            bracket += 1
+        elif token == "]":
+            bracket -= 1
+    return brace, bracket
+
+
+# Common Python->JSON fixes: " True" -> " true", " False" -> " false", " None" -> " null"
+_PYTHON_LITERALS = re.compile(r" (True|False|None)\b")
+_JSON_LITERALS = {"True": " true", "False": " false", "None": " null"}
+
 
-    for line in lines:
-        stripped = line.strip()
+_NOT_JSON_OBJECT = re.compile(r'\s*\{\s*[^"}\s]')
 
+
+def fence_json(raw: str) -> str:
+    return f"\n```json\n{raw}\n```\n"
+
+
+def json_block_spans(lines: list[str]) -> Iterator[tuple[int, int, bool]]:
+    """Yield (start, end, closed) line ranges of candidate JSON blocks.
+
+    A block opens on a line starting with "{" or "[" and closes after the first
+    following line at which brace and bracket depth are both back to zero. A block
+    still open at the end of the doc is yielded with closed=False.
+    """
+    start = -1
+    brace_count = bracket_count = 0
+    for index, line in enumerate(lines):
         # Detect start of potential JSON block
-        if not in_json_block:
-            if stripped.startswith("{") or stripped.startswith("["):
-                in_json_block = True
-                json_lines_raw = [line]
-                brace_count = line.count("{") - line.count("}")
-                bracket_count = line.count("[") - line.count("]")
-            else:
-                result.append(line)
-        else:
-            json_lines_raw.append(line)
-            brace_count += line.count("{") - line.count("}")
-            bracket_count += line.count("[") - line.count("]")
-
-            # End of block when counts balance
-            if brace_count == 0 and bracket_count == 0:
-                in_json_block = False
-                json_content_raw = "\n".join(json_lines_raw)
-                json_content_stripped = "\n".join(
-                    line.strip() for line in json_lines_raw
-                )
+        if start < 0:
+            if line.lstrip().startswith(("{", "[")):
+                start = index
+                brace_count, bracket_count = bracket_deltas(line)
+            continue
+        brace_delta, bracket_delta = bracket_deltas(line)
+        brace_count += brace_delta
+        bracket_count += bracket_delta
+        # End of block when counts balance
+        if brace_count == 0 and bracket_count == 0:
+            yield start, index + 1, True
+            start = -1
+    if start >= 0:
+        yield start, len(lines), False
+
+
+def _json_candidates(raw: str) -> Iterator[str]:
+    # Raw first, then with common fixes; the fixed text is only built if needed,
+    # and only parsed again if a fix actually applied
+    yield raw
+    fixed, count = _PYTHON_LITERALS.subn(lambda m: _JSON_LITERALS[m[1]], raw)
+    if count:
+        yield fixed
+
+
+def format_json_block(block: list[str]) -> str:
+    """Fence a JSON block, pretty-printed if it parses as is or after fixes."""
+    raw = "\n".join(block)
+    # A JSON object opens with a key or closes at once; placeholders such as
+    # "{user_id}" can never parse, even after the literal fixes
+    if _NOT_JSON_OBJECT.match(raw):
+        return fence_json(raw)
+    for candidate in _json_candidates(raw):
+        try:
+            parsed = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            continue
+        return fence_json(orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode())
+    # Give up parsing; still wrap the original block in fences
+    return fence_json(raw)
 
-                # Try parsing as JSON (raw first, then with common fixes)
-                def fence(raw: str) -> str:
-                    return f"\n```json\n{raw}\n```\n"
-
-                try:
-                    parsed = json.loads(json_content_raw)
-                    formatted = json.dumps(parsed, indent=2)
-                    result.append(fence(formatted))
-                except json.JSONDecodeError:
-                    try:
-                        parsed = json.loads(json_content_stripped)
-                        formatted = json.dumps(parsed, indent=2)
-                        result.append(fence(formatted))
-                    except json.JSONDecodeError:
-                        # Common Python->JSON fixes
-                        fixed = (
-                            json_content_stripped
-                            .replace(" True", " true")
-                            .replace(": True", ": true")
-                            .replace(" False", " false")
-                            .replace(": False", ": false")
-                            .replace(" None", " null")
-                            .replace(": None", ": null")
-                        )
-                        try:
-                            parsed = json.loads(fixed)
-                            formatted = json.dumps(parsed, indent=2)
-                            result.append(fence(formatted))
-                        except json.JSONDecodeError:
-                            # Give up parsing; still wrap the original block in fences
-                            result.append(fence(json_content_raw))
-
-    # If doc ends while still in a block, close by fencing what we have
-    if in_json_block and json_lines_raw:
-        result.append("\n```json\n" + "\n".join(json_lines_raw) + "\n```\n")
 
+def format_json_in_doc(doc: str) -> str:
+    """Format JSON content in documentation with proper JSON code blocks."""
+    # Most docstrings hold no JSON at all: no block can start without a bracket
+    if "{" not in doc and "[" not in doc:
+        return doc
+    lines = doc.split("\n")
+    result: list[str] = []
+    position = 0
+    for start, end, closed in json_block_spans(lines):
+        result.extend(lines[position:start])
+        block = lines[start:end]
+        # If doc ends while still in a block, close by fencing what we have
+        result.append(
+            format_json_block(block) if closed else fence_json("\n".join(block))
+        )
+        position = end
+    result.extend(lines[position:])
     return "\n".join(result)
 
 
+def _ignore_walk_error(name: str) -> None:
+    pass
+
+
 def iter_modules(package: str) -> Iterator[ModuleType]:
     mod = importlib.import_module(package)
     mod_file = getattr(mod, "__file__", None)
     if mod_file is None:
         return
     base = Path(mod_file).parent
-    for m in pkgutil.walk_packages([str(base)], prefix=mod.__name__ + "."):
+    # Private modules (e.g. __version__) hold no documented models; skip importing
+    # them, and don't let a broken subpackage abort the walk.
+    names = [
+        m.name
+        for m in pkgutil.walk_packages(
+            [str(base)], prefix=mod.__name__ + ".", onerror=_ignore_walk_error
+        )
+        if not m.name.rpartition(".")[2].startswith("_")
+    ]
+    # Import the modules not loaded yet concurrently, so file reads overlap, then
+    # yield in walk order so the generated pages keep a stable model order.
+    pending = [name for name in names if name not in sys.modules]
+    with ThreadPoolExecutor(max_workers=min(32, len(pending) or 1)) as pool:
+        futures = {name: pool.submit(importlib.import_module, name) for name in pending}
+    for name in names:
+        future = futures.get(name)
         try:
-            yield importlib.import_module(m.name)
+            yield sys.modules[name] if future is None else future.result()
         except Exception:
-            pass
+            # Concurrent imports of circular modules can fail on the import lock;
+            # retry serially before giving up on the module.
+            try:
+                yield importlib.import_module(name)
+            except Exception:
+                pass
+
 
+# From the first colon to the last ">", e.g. " 'string'" in <Enum.VALUE: 'string'>
+_ENUM_VALUE = re.compile(r":(.*)>", re.DOTALL)
+_MDX_ESCAPES = str.maketrans({"<": "&lt;", ">": "&gt;"})
 
+
+@lru_cache(maxsize=2048)
 def sanitize_default_for_mdx(default_repr: str) -> str:
     """Sanitize default value representation to avoid MDX parsing issues."""
     # Replace enum representations that contain colons with a safer format
-    if "<" in default_repr and ":" in default_repr and ">" in default_repr:
-        # This looks like an enum representation like <Enum.VALUE: 'string'>
-        # Extract the enum name and value
-        try:
-            # Find the colon and extract the value part
-            colon_pos = default_repr.find(":")
-            if colon_pos != -1:
-                # Get the part after the colon, before the closing >
-                value_start = colon_pos + 1
-                value_end = default_repr.rfind(">")
-                if value_end != -1:
-                    value_part = default_repr[value_start:value_end].strip()
-                    # Remove quotes if present
-                    if (
-                        value_part.startswith("'")
-                        and value_part.endswith("'")
-                        or value_part.startswith('"')
-                        and value_part.endswith('"')
-                    ):
-                        value_part = value_part[1:-1]
-                    return f"`{value_part}`"
-        except Exception:
-            pass
+    if not ("<" in default_repr and ":" in default_repr and ">" in default_repr):
+        return default_repr
+    # This looks like an enum representation like <Enum.VALUE: 'string'>
+    match = _ENUM_VALUE.search(default_repr)
+    if match is None:
         # Fallback: just escape the angle brackets
-        return default_repr.replace("<", "&lt;").replace(">", "&gt;")
-
-    return default_repr
-
-
+        return default_repr.translate(_MDX_ESCAPES)
+    value_part = match.group(1).strip()
+    # Remove quotes if present
+    if (
+        len(value_part) >= 2
+        and value_part[0] == value_part[-1]
+        and value_part[0] in "'\""
+    ):
+        value_part = value_part[1:-1]
+    return f"`{value_part}`"
+
+
+@lru_cache(maxsize=2048)
 def clean_type_string(type_str: str) -> str:
     """Clean up type strings to make them more readable."""
     # Remove typing. prefix from common types
@@ -256,88 +322,125 @@ def clean_type_string(type_str: str) -> str:
     return type_str
 
 
+# Pipe separator between union members, escaped for markdown tables
+_MD_PIPE = " \\| "
+
+# Formatted type strings, keyed by str(annotation). The key must be the string,
+# not the annotation: e.g. `int | None == Optional[int]`, yet they format differently.
+_TYPE_STRINGS: dict[str, str] = {}
+
+
+def format_type(type_obj: Any) -> str:
+    """Format a field annotation as backticked markdown, e.g. `str` \\| `int`."""
+    key = str(type_obj)
+    type_str = _TYPE_STRINGS.get(key)
+    if type_str is None:
+        type_str = _TYPE_STRINGS[key] = _format_type(type_obj, key)
+    return type_str
+
+
+def _format_union_arg(arg: Any) -> str:
+    if get_args(arg):
+        # Complex type like list[str], dict[str, int], etc.
+        return f"`{arg!s}`"
+    return f"`{arg.__name__ if hasattr(arg, '__name__') else arg!s}`"
+
+
+def _format_type(type_obj: Any, type_repr: str) -> str:
+    if get_origin(type_obj) in (Union, UnionType):
+        # Handle Union types (e.g., str | None)
+        type_args = get_args(type_obj)
+        # Skip None types, we'll handle them via default value
+        non_none_types = [
+            _format_union_arg(arg) for arg in type_args if arg is not NoneType
+        ]
+
+        # If we have non-None types, use them; otherwise fall back to original logic
+        if non_none_types:
+            type_str = _MD_PIPE.join(non_none_types)
+        else:
+            # Fallback to original logic if no non-None types found
+            type_str = _MD_PIPE.join(
+                "`None`" if arg is NoneType else _format_union_arg(arg)
+                for arg in type_args
+            )
+    # String annotations (e.g. dataclass fields under postponed evaluation) can
+    # only be recognized by their text.
+    elif type_repr.startswith("typing.Union"):
+        # Handle older Union syntax
+        type_str = (
+            type_repr.replace("typing.Union[", "").replace("]", "").replace(", ", " | ")
+        )
+        # Add backticks around each type
+        type_parts = type_str.split(" | ")
+        type_parts = [f"`{part.strip()}`" for part in type_parts]
+        type_str = _MD_PIPE.join(type_parts)
+    elif type_repr.startswith("typing.Optional"):
+        # Handle Optional types (which are Union[T, None])
+        inner_type = type_repr.replace("typing.Optional[", "").replace("]", "")
+        cleaned_inner_type = clean_type_string(inner_type)
+        type_str = f"`{cleaned_inner_type}` | `None`"
+    else:
+        # Handle generic types and other types
+        type_str = f"`{clean_type_string(type_repr)}`"
+
+    return type_str
+
+
+# Collection defaults larger than this are summarized instead of repr'd in full
+MAX_DEFAULT_ITEMS = 8
+_COLLECTION_TYPES = (dict, list, tuple, set, frozenset)
+
+
+def summarize_default(default_val: Any) -> str | None:
+    """Short form such as `dict(len=12)` for a large collection default, else None."""
+    if (
+        isinstance(default_val, _COLLECTION_TYPES)
+        and len(default_val) > MAX_DEFAULT_ITEMS
+    ):
+        return f"`{type(default_val).__name__}(len={len(default_val)})`"
+    return None
+
+
+def format_default(default_val: Any) -> str:
+    """Markdown for a non-required field's default value."""
+    if default_val is None:
+        return "`None`"
+    # Hide Pydantic undefined sentinels
+    if default_val is PydanticUndefined:
+        return "—"
+    summary = summarize_default(default_val)
+    if summary is not None:
+        return summary
+    s = repr(default_val)
+    if "Undefined" in s:
+        return "—"
+    return sanitize_default_for_mdx(s)
+
+
+def _field_info_row(name: str, field: FieldInfo) -> tuple[str, str, str, str]:
+    # Pydantic v2 fast path: FieldInfo attributes are known, no getattr probing
+    required = field.is_required()
+    return (
+        name,
+        format_type(field.annotation or None),
+        "**required**" if required else format_default(field.default),
+        field.description or "",
+    )
+
+
 def get_model_fields(model: type[BaseModel]) -> list[tuple[str, str, str, str]]:
     fields = getattr(model, "model_fields", {})
     result: list[tuple[str, str, str, str]] = []
     for name, field in fields.items():
+        if isinstance(field, FieldInfo):
+            result.append(_field_info_row(name, field))
+            continue
+
         # Try to get type/annotation consistently across pydantic versions
         type_obj = getattr(field, "annotation", None) or getattr(field, "type_", None)
 
-        # Format type string properly
-        if (
-            type_obj is not None
-            and hasattr(type_obj, "__origin__")
-            and getattr(type_obj, "__origin__", None) is Union
-        ) or (
-            type_obj is not None
-            and hasattr(type_obj, "__args__")
-            and type(type_obj).__name__ == "UnionType"
-        ):
-            # Handle Union types (e.g., str | None)
-            type_args = getattr(type_obj, "__args__", [])
-            type_parts = []
-            non_none_types = []
-            for arg in type_args:
-                if arg is type(None):
-                    # Skip None types, we'll handle them via default value
-                    continue
-                else:
-                    # Handle complex types like list[str]
-                    arg_str = str(arg)
-                    if "[" in arg_str and "]" in arg_str:
-                        # Complex type like list[str], dict[str, int], etc.
-                        non_none_types.append(f"`{arg_str}`")
-                    else:
-                        non_none_types.append(
-                            f"`{arg.__name__ if hasattr(arg, '__name__') else arg!s}`"
-                        )
-
-            # If we have non-None types, use them; otherwise fall back to original logic
-            if non_none_types:
-                type_str = " \\| ".join(non_none_types)
-            else:
-                # Fallback to original logic if no non-None types found
-                for arg in type_args:
-                    if arg is type(None):
-                        type_parts.append("`None`")
-                    else:
-                        # Handle complex types like list[str]
-                        arg_str = str(arg)
-                        if "[" in arg_str and "]" in arg_str:
-                            # Complex type like list[str], dict[str, int], etc.
-                            type_parts.append(f"`{arg_str}`")
-                        else:
-                            type_parts.append(
-                                f"`{arg.__name__ if hasattr(arg, '__name__') else arg!s}`"
-                            )
-                type_str = " \\| ".join(type_parts)
-        elif type_obj is not None and str(type_obj).startswith("typing.Union"):
-            # Handle older Union syntax
-            type_str = (
-                str(type_obj)
-                .replace("typing.Union[", "")
-                .replace("]", "")
-                .replace(", ", " | ")
-            )
-            # Add backticks around each type
-            type_parts = type_str.split(" | ")
-            type_parts = [f"`{part.strip()}`" for part in type_parts]
-            type_str = " \\| ".join(type_parts)
-        elif type_obj is not None and str(type_obj).startswith("typing.Optional"):
-            # Handle Optional types (which are Union[T, None])
-            inner_type = str(type_obj).replace("typing.Optional[", "").replace("]", "")
-            cleaned_inner_type = clean_type_string(inner_type)
-            type_str = f"`{cleaned_inner_type}` | `None`"
-        else:
-            # Handle generic types and other types
-            type_str_raw = str(type_obj)
-            if "[" in type_str_raw and "]" in type_str_raw:
-                # Complex type like list[str], dict[str, int], etc.
-                cleaned_type = clean_type_string(type_str_raw)
-                type_str = f"`{cleaned_type}`"
-            else:
-                cleaned_type = clean_type_string(type_str_raw)
-                type_str = f"`{cleaned_type}`"
+        type_str = format_type(type_obj)
 
         # Required detection compatible with pydantic v1/v2
         required: bool
@@ -359,28 +462,22 @@ def get_model_fields(model: type[BaseModel]) -> list[tuple[str, str, str, str]]:
         default_repr: str
         if required:
             default_repr = "**required**"
+        elif hasattr(field, "default"):
+            default_repr = format_default(field.default)
         else:
-            if hasattr(field, "default"):
-                default_val = field.default
-                # Hide Pydantic undefined sentinels
-                if default_val is None:
-                    default_repr = "`None`"
-                else:
-                    s = repr(default_val)
-                    if "Undefined" in s or "PydanticUndefined" in s:
-                        default_repr = "—"
-                    else:
-                        default_repr = sanitize_default_for_mdx(s)
-            else:
-                default_repr = "—"
+            default_repr = "—"
 
         result.append((name, type_str, default_repr, desc))
     return result
 
 
+# (model, heading text, slug) for each documented class
+DocEntry = tuple[type[BaseModel] | type, str, str]
+
+
 def get_parent_model(
     model: type[BaseModel],
-    models_by_group: dict[str, list[type[BaseModel] | type]],
+    model_to_group: dict[type, str],
 ) -> type[BaseModel] | None:
     """Find the parent model that is also documented in the same group."""
     if not issubclass(model, BaseModel):
@@ -395,22 +492,18 @@ def get_parent_model(
 
     # Find the parent that is also in our documented models
     for base in bases:
-        for group_models in models_by_group.values():
-            if base in group_models:
-                return base
+        if base in model_to_group:
+            return base
 
     return None
 
 
 def get_model_group(
     model: type[BaseModel],
-    models_by_group: dict[str, list[type[BaseModel] | type]],
+    model_to_group: dict[type, str],
 ) -> str:
     """Find which group a model belongs to."""
-    for group_name, group_models in models_by_group.items():
-        if model in group_models:
-            return group_name
-    return "extra"  # fallback
+    return model_to_group.get(model, "extra")  # fallback
 
 
 def get_dataclass_fields(model: Any) -> list[tuple[str, str, str, str]]:
@@ -419,81 +512,7 @@ def get_dataclass_fields(model: Any) -> list[tuple[str, str, str, str]]:
     for name, field in fields.items():
         type_ = getattr(field, "type", str)
 
-        # Format type string properly
-        if (
-            type_ is not None
-            and hasattr(type_, "__origin__")
-            and getattr(type_, "__origin__", None) is Union
-        ) or (
-            type_ is not None
-            and hasattr(type_, "__args__")
-            and type(type_).__name__ == "UnionType"
-        ):
-            # Handle Union types (e.g., str | None)
-            type_args = getattr(type_, "__args__", [])
-            type_parts = []
-            non_none_types = []
-            for arg in type_args:
-                if arg is type(None):
-                    # Skip None types, we'll handle them via default value
-                    continue
-                else:
-                    # Handle complex types like list[str]
-                    arg_str = str(arg)
-                    if "[" in arg_str and "]" in arg_str:
-                        # Complex type like list[str], dict[str, int], etc.
-                        non_none_types.append(f"`{arg_str}`")
-                    else:
-                        non_none_types.append(
-                            f"`{arg.__name__ if hasattr(arg, '__name__') else arg!s}`"
-                        )
-
-            # If we have non-None types, use them; otherwise fall back to original logic
-            if non_none_types:
-                type_str = " \\| ".join(non_none_types)
-            else:
-                # Fallback to original logic if no non-None types found
-                for arg in type_args:
-                    if arg is type(None):
-                        type_parts.append("`None`")
-                    else:
-                        # Handle complex types like list[str]
-                        arg_str = str(arg)
-                        if "[" in arg_str and "]" in arg_str:
-                            # Complex type like list[str], dict[str, int], etc.
-                            type_parts.append(f"`{arg_str}`")
-                        else:
-                            type_parts.append(
-                                f"`{arg.__name__ if hasattr(arg, '__name__') else arg!s}`"
-                            )
-                type_str = " \\| ".join(type_parts)
-        elif type_ is not None and str(type_).startswith("typing.Union"):
-            # Handle older Union syntax
-            type_str = (
-                str(type_)
-                .replace("typing.Union[", "")
-                .replace("]", "")
-                .replace(", ", " | ")
-            )
-            # Add backticks around each type
-            type_parts = type_str.split(" | ")
-            type_parts = [f"`{part.strip()}`" for part in type_parts]
-            type_str = " \\| ".join(type_parts)
-        elif type_ is not None and str(type_).startswith("typing.Optional"):
-            # Handle Optional types (which are Union[T, None])
-            inner_type = str(type_).replace("typing.Optional[", "").replace("]", "")
-            cleaned_inner_type = clean_type_string(inner_type)
-            type_str = f"`{cleaned_inner_type}` | `None`"
-        else:
-            # Handle generic types and other types
-            type_str_raw = str(type_)
-            if "[" in type_str_raw and "]" in type_str_raw:
-                # Complex type like list[str], dict[str, int], etc.
-                cleaned_type = clean_type_string(type_str_raw)
-                type_str = f"`{cleaned_type}`"
-            else:
-                cleaned_type = clean_type_string(type_str_raw)
-                type_str = f"`{cleaned_type}`"
+        type_str = format_type(type_)
 
         required = (
             field.default is dataclasses.MISSING
@@ -504,7 +523,10 @@ def get_dataclass_fields(model: Any) -> list[tuple[str, str, str, str]]:
             if required
             else "`None`"
             if field.default is None
-            else sanitize_default_for_mdx(repr(field.default))
+            else (
+                summarize_default(field.default)
+                or sanitize_default_for_mdx(repr(field.default))
+            )
             if field.default is not dataclasses.MISSING
             else "factory"
         )
@@ -513,19 +535,167 @@ def get_dataclass_fields(model: Any) -> list[tuple[str, str, str, str]]:
     return result
 
 
+_MODULE_SHORT: dict[type, str] = {}
+_CLASS_DOCS: dict[type, str | None] = {}
+
+
+def module_short(model: type) -> str:
+    """Module path of a class without the "supervaizer." prefix, cached per class."""
+    name = _MODULE_SHORT.get(model)
+    if name is None:
+        name = _MODULE_SHORT[model] = model.__module__.removeprefix(PACKAGE_PREFIX)
+    return name
+
+
+def class_doc(model: type) -> str | None:
+    """inspect.getdoc() of a class, cached per class."""
+    if model not in _CLASS_DOCS:
+        _CLASS_DOCS[model] = inspect.getdoc(model)
+    return _CLASS_DOCS[model]
+
+
+_MODEL_CONFIGS: WeakKeyDictionary[type, dict[str, Any]] = WeakKeyDictionary()
+
+
+def model_config_of(model: type) -> dict[str, Any]:
+    """model_config of a class (class attribute, then own __dict__), cached per class."""
+    config = _MODEL_CONFIGS.get(model)
+    if config is None:
+        config = (
+            getattr(model, "model_config", None)
+            or vars(model).get("model_config")
+            or {}
+        )
+        _MODEL_CONFIGS[model] = config
+    return config
+
+
+_MODEL_EXAMPLES: dict[type, tuple[Any, list[Any]]] = {}
+
+
+def model_examples(model: type) -> tuple[Any, list[Any]]:
+    """(example_dict, json_schema_extra examples) of a model, cached per class."""
+    examples = _MODEL_EXAMPLES.get(model)
+    if examples is None:
+        model_config = model_config_of(model)
+        json_schema_extra = model_config.get("json_schema_extra", {})
+        examples = _MODEL_EXAMPLES[model] = (
+            model_config.get("example_dict"),
+            json_schema_extra.get("examples", []),
+        )
+    return examples
+
+
+def _example_default(obj: Any) -> Any:
+    # Type objects in examples are shown by name
+    if isinstance(obj, type):
+        return obj.__name__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_example(example: Any) -> str:
+    """Pretty-print a model example as JSON."""
+    return orjson.dumps(
+        example,
+        default=_example_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+# Field table row from a (name, type, default, description) tuple
+format_table_row = "| `{0}` | {1} | {2} | {3} |".format
+
+FIELD_TABLE_HEADER = "| Field | Type | Default | Description |\n|---|---|---|---|\n"
+
+
+def format_field_table(rows: list[tuple[str, str, str, str]]) -> str:
+    """Render a field table as one block, ending with a blank line."""
+    return FIELD_TABLE_HEADER + "\n".join(starmap(format_table_row, rows)) + "\n"
+
+
 def add_header(page_name: str) -> list[str]:
     """Add header content to the documentation."""
     out = [page_name, ""]
     return out
 
 
-def add_footer() -> list[str]:
-    """Add footer content with timestamp to the documentation."""
+FOOTER_PREFIX = "*Uploaded on "
+
+
+@lru_cache(maxsize=1)
+def add_footer() -> str:
+    """Footer content with timestamp, rendered once so a run shares one timestamp."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    out = []
-    out.append("")
-    out.append(f"*Uploaded on {timestamp}*")
-    return out
+    return f"\n{FOOTER_PREFIX}{timestamp}*"
+
+
+def strip_footer(text: str) -> str:
+    """Return the page content that precedes the add_footer() text."""
+    return text.rpartition(f"\n\n{FOOTER_PREFIX}")[0]
+
+
+# The same separator in copied reference files, which are handled as bytes
+_FOOTER_SEPARATOR = f"\n\n{FOOTER_PREFIX}".encode()
+
+
+def sync_tree(src: Path, dst: Path) -> int:
+    """Mirror src into dst, copying only files whose size or mtime differ.
+
+    Files are copied with shutil.copy2, which keeps the source mtime so the next
+    run can skip them. Entries missing from src are removed from dst.
+    Returns the number of files copied.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    copied = 0
+    names: set[str] = set()
+    with os.scandir(src) as entries:
+        for entry in entries:
+            names.add(entry.name)
+            target = dst / entry.name
+            # One lstat per target answers "missing?", "directory?" and "changed?"
+            try:
+                dst_stat: os.stat_result | None = target.lstat()
+            except FileNotFoundError:
+                dst_stat = None
+            dst_is_dir = dst_stat is not None and S_ISDIR(dst_stat.st_mode)
+            if entry.is_dir(follow_symlinks=False):
+                if dst_stat is not None and not dst_is_dir:
+                    target.unlink()
+                copied += sync_tree(Path(entry.path), target)
+                continue
+            if dst_is_dir:
+                shutil.rmtree(target)
+                dst_stat = None
+            src_stat = entry.stat()
+            if (
+                dst_stat is None
+                or dst_stat.st_size != src_stat.st_size
+                or dst_stat.st_mtime_ns != src_stat.st_mtime_ns
+            ):
+                shutil.copy2(entry.path, target)
+                copied += 1
+    with os.scandir(dst) as entries:
+        for entry in entries:
+            if entry.name not in names:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+    return copied
+
+
+def write_group_page(group_name: str, output_file: Path, page: str) -> None:
+    """Write a group's page, leaving it (and its timestamp) alone if unchanged."""
+    if (
+        output_file.is_file()
+        and strip_footer(output_file.read_text(encoding="utf-8")) == page
+    ):
+        print(f"⏭️  Model reference for group '{group_name}' is unchanged")
+        return
+
+    # Add timestamp at the bottom; the page is written in a single call
+    output_file.write_text(f"{page}\n{add_footer()}", encoding="utf-8")
+    print(f"✅ Wrote model reference for group '{group_name}' to {output_file}")
 
 
 def generate_model_docs() -> None:
@@ -541,68 +711,72 @@ def generate_model_docs() -> None:
     LOCAL_MODEL_DOCS.mkdir(parents=True, exist_ok=True)
 
     # Get all models and their reference_group
-    models_by_group: dict[str, list[type[BaseModel] | type]] = {}
-    seen = set()
+    models_by_group: dict[str, list[DocEntry]] = {}
+    # Every package class already classified, documented or not, so re-exports of
+    # it in later modules are skipped before any issubclass() call
+    seen: set[type] = set()
 
     # Track all generated slugs across all files for link validation
     all_slugs: dict[str, set[str]] = {}
 
+    # Field names per documented parent, shared by all of its subclasses
+    field_names_cache: dict[type, set[str]] = {}
+
     for mod in iter_modules(PACKAGE):
-        for name, obj in inspect.getmembers(mod, inspect.isclass):
-            if obj in seen or obj.__module__.startswith("pydantic"):
+        # Same name order as inspect.getmembers, but only classes get sorted
+        classes = [item for item in vars(mod).items() if isinstance(item[1], type)]
+        for _, obj in sorted(classes, key=itemgetter(0)):
+            # Cheap module check first: skips re-exported foreign classes before
+            # any issubclass() MRO walk
+            if not obj.__module__.startswith(PACKAGE_PREFIX) or obj in seen:
                 continue
             if issubclass(obj, BaseModel):
                 # Get the reference_group from model_config
-                # Try different ways to access model_config
-                model_config = getattr(obj, "model_config", {})
-                if not model_config:
-                    # Try accessing it as a class attribute
-                    model_config = getattr(obj, "__dict__", {}).get("model_config", {})
-                if not model_config:
-                    # Try accessing it from the class itself
-                    model_config = getattr(type(obj), "model_config", {})
+                model_config = model_config_of(obj)
                 # Check for both reference_group and documentation fields
                 reference_group = model_config.get(
                     "reference_group", model_config.get("documentation", "extra")
                 )
-                if reference_group not in models_by_group:
-                    models_by_group[reference_group] = []
-                models_by_group[reference_group].append(obj)
-                seen.add(obj)
             elif dataclasses.is_dataclass(obj):
                 # Dataclasses go to "extra" group
-                if "extra" not in models_by_group:
-                    models_by_group["extra"] = []
-                models_by_group["extra"].append(obj)
+                reference_group = "extra"
+            else:
                 seen.add(obj)
-
-    # First pass: build all slugs for link validation
-    for group_name, models in models_by_group.items():
-        if group_name not in all_slugs:
-            all_slugs[group_name] = set()
-        for model in models:
-            module_name = model.__module__.replace("supervaizer.", "")
-            heading_text = f"{module_name}.{model.__name__}"
+                continue
+            # Heading and slug are computed once; all_slugs feeds link validation
+            heading_text = f"{module_short(obj)}.{obj.__name__}"
             slug = generate_slug(heading_text)
-            all_slugs[group_name].add(slug)
-
-    # Second pass: generate documentation for each group
-    for group_name, models in models_by_group.items():
+            models_by_group.setdefault(reference_group, []).append((
+                obj,
+                heading_text,
+                slug,
+            ))
+            all_slugs.setdefault(reference_group, set()).add(slug)
+            seen.add(obj)
+
+    # Reverse index for parent and group lookups
+    model_to_group = {
+        model: group_name
+        for group_name, entries in models_by_group.items()
+        for model, _, _ in entries
+    }
+
+    # (group name, output file, page) for each group, written once all are rendered
+    pages: list[tuple[str, Path, str]] = []
+
+    # Generate documentation for each group
+    for group_name, entries in models_by_group.items():
         out = add_header(f"# Model Reference {group_name}")
         out.append(f"**Version:** {version}\n")
 
-        for model in models:
-            # Remove "supervaizer." prefix from module name
-            module_name = model.__module__.replace("supervaizer.", "")
-            heading_text = f"{module_name}.{model.__name__}"
-            slug = generate_slug(heading_text)
+        for model, heading_text, slug in entries:
             out.append(f"### `{heading_text}`\n")
 
             # Check if this model inherits from another documented model
-            parent_model = get_parent_model(model, models_by_group)
+            parent_model = get_parent_model(model, model_to_group)
             if parent_model:
-                parent_module = parent_model.__module__.replace("supervaizer.", "")
-                parent_group = get_model_group(parent_model, models_by_group)
+                parent_module = module_short(parent_model)
+                parent_group = get_model_group(parent_model, model_to_group)
 
                 # Generate the expected slug for the parent
                 parent_heading = f"{parent_module}.{parent_model.__name__}"
@@ -643,12 +817,12 @@ def generate_model_docs() -> None:
                         )
 
             # Show class description, but hide if it's the same as parent's
-            doc = inspect.getdoc(model)
+            doc = class_doc(model)
             if doc:
                 # Check if parent has the same description
                 parent_has_same_doc = False
                 if parent_model:
-                    parent_doc = inspect.getdoc(parent_model)
+                    parent_doc = class_doc(parent_model)
                     if parent_doc == doc:
                         parent_has_same_doc = True
 
@@ -680,117 +854,56 @@ def generate_model_docs() -> None:
 
             # If this model inherits from another documented model, show only new fields
             if parent_model:
-                parent_fields = (
-                    get_model_fields(parent_model)
-                    if issubclass(parent_model, BaseModel)
-                    else get_dataclass_fields(parent_model)
-                )
-                parent_field_names = {field[0] for field in parent_fields}
+                parent_field_names = field_names_cache.get(parent_model)
+                if parent_field_names is None:
+                    # Only the names are needed, so skip the type/default formatting
+                    parent_field_names = field_names_cache[parent_model] = set(
+                        getattr(parent_model, "model_fields", None)
+                        or getattr(parent_model, "__dataclass_fields__", {})
+                    )
                 new_fields = [
                     field for field in rows if field[0] not in parent_field_names
                 ]
 
                 if new_fields:
                     out.append("#### Model Fields\n")
-                    out.append("| Field | Type | Default | Description |")
-                    out.append("|---|---|---|---|")
-                    for f, t, d, desc in new_fields:
-                        out.append(f"| `{f}` | {t} | {d} | {desc} |")
-                    out.append("")
+                    out.append(format_field_table(new_fields))
                 else:
                     out.append("_No additional fields beyond parent class._\n")
             else:
                 # Show all fields for models without inheritance
-                out.append("| Field | Type | Default | Description |")
-                out.append("|---|---|---|---|")
-                for f, t, d, desc in rows:
-                    out.append(f"| `{f}` | {t} | {d} | {desc} |")
-                out.append("")
+                out.append(format_field_table(rows))
 
             # Add examples if available in model_config
             if issubclass(model, BaseModel):
-                model_config = getattr(model, "model_config", {})
-                if not model_config:
-                    model_config = getattr(model, "__dict__", {}).get(
-                        "model_config", {}
-                    )
-                if not model_config:
-                    model_config = getattr(type(model), "model_config", {})
-
-                # Custom JSON encoder to handle type objects
-                class TypeEncoder(json.JSONEncoder):
-                    def default(self, obj: Any) -> Any:
-                        if isinstance(obj, type):
-                            return obj.__name__
-                        return super().default(obj)
-
-                # Check for example_dict
-                example_dict = model_config.get("example_dict")
-                if example_dict:
-                    # Check if parent also has the same example to avoid duplication
-                    parent_has_same_example = False
-                    if parent_model:
-                        parent_model_config = getattr(parent_model, "model_config", {})
-                        if not parent_model_config:
-                            parent_model_config = getattr(
-                                parent_model, "__dict__", {}
-                            ).get("model_config", {})
-                        if not parent_model_config:
-                            parent_model_config = getattr(
-                                type(parent_model), "model_config", {}
-                            )
-
-                        parent_example = parent_model_config.get("example_dict")
-                        if parent_example == example_dict:
-                            parent_has_same_example = True
-
-                    if not parent_has_same_example:
+                example_dict, examples = model_examples(model)
+                # Parent examples, looked up once for both duplicate checks below
+                parent_example, parent_examples = (
+                    model_examples(parent_model) if parent_model else (None, None)
+                )
+
+                # Check for example_dict, skipped if the parent has the same one
+                if example_dict and example_dict != parent_example:
+                    out.append("#### Example\n")
+                    out.append("```json\n")
+                    out.append(dump_example(example_dict))
+                    out.append("\n```\n")
+
+                # Check for json_schema_extra["examples"], skipped if the parent has
+                # the same ones
+                if examples and examples != parent_examples:
+                    if len(examples) == 1:
                         out.append("#### Example\n")
                         out.append("```json\n")
-                        out.append(json.dumps(example_dict, indent=2, cls=TypeEncoder))
+                        out.append(dump_example(examples[0]))
                         out.append("\n```\n")
-
-                # Check for json_schema_extra["examples"]
-                json_schema_extra = model_config.get("json_schema_extra", {})
-                examples = json_schema_extra.get("examples", [])
-                if examples:
-                    # Check if parent also has the same examples to avoid duplication
-                    parent_has_same_examples = False
-                    if parent_model:
-                        parent_model_config = getattr(parent_model, "model_config", {})
-                        if not parent_model_config:
-                            parent_model_config = getattr(
-                                parent_model, "__dict__", {}
-                            ).get("model_config", {})
-                        if not parent_model_config:
-                            parent_model_config = getattr(
-                                type(parent_model), "model_config", {}
-                            )
-
-                        parent_json_schema_extra = parent_model_config.get(
-                            "json_schema_extra", {}
-                        )
-                        parent_examples = parent_json_schema_extra.get("examples", [])
-                        if parent_examples == examples:
-                            parent_has_same_examples = True
-
-                    if not parent_has_same_examples:
-                        if len(examples) == 1:
-                            out.append("#### Example\n")
+                    else:
+                        out.append("#### Examples\n")
+                        for i, example in enumerate(examples, 1):
+                            out.append(f"**Example {i}:**\n")
                             out.append("```json\n")
-                            out.append(
-                                json.dumps(examples[0], indent=2, cls=TypeEncoder)
-                            )
+                            out.append(dump_example(example))
                             out.append("\n```\n")
-                        else:
-                            out.append("#### Examples\n")
-                            for i, example in enumerate(examples, 1):
-                                out.append(f"**Example {i}:**\n")
-                                out.append("```json\n")
-                                out.append(
-                                    json.dumps(example, indent=2, cls=TypeEncoder)
-                                )
-                                out.append("\n```\n")
 
         # Determine output filename based on group name
         if group_name == "extra":
@@ -798,27 +911,62 @@ def generate_model_docs() -> None:
         else:
             filename = f"model_{group_name}.md".lower()
 
-        output_file = LOCAL_MODEL_DOCS / filename
-
-        # Add timestamp at the bottom
-        out.extend(add_footer())
+        pages.append((group_name, LOCAL_MODEL_DOCS / filename, "\n".join(out)))
 
-        output_file.write_text("\n".join(out))
-        print(f"✅ Wrote model reference for group '{group_name}' to {output_file}")
+    # Rendering above holds the GIL; the page reads and writes overlap in threads
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(pages)))) as pool:
+        for future in [pool.submit(write_group_page, *page) for page in pages]:
+            future.result()
 
     # Copy to external documentation directory
     try:
-        # Ensure the target directory exists
-        EXTERNAL_DOC_PATH.parent.mkdir(parents=True, exist_ok=True)
+        copied = sync_tree(LOCAL_MODEL_DOCS, EXTERNAL_DOC_PATH)
+        print(
+            f"✅ Synced model reference directory to {EXTERNAL_DOC_PATH} "
+            f"({copied} file(s) updated)"
+        )
+    except Exception as e:
+        print(f"⚠️  Failed to copy to external directory: {e}")
+
 
-        # Remove existing directory if it exists
-        if EXTERNAL_DOC_PATH.exists():
-            shutil.rmtree(EXTERNAL_DOC_PATH)
+def copy_reference_file(md_file: Path, footer: bytes) -> bool:
+    """Copy one markdown file to EXTERNAL_REF_PATH with the footer appended.
 
-        shutil.copytree(LOCAL_MODEL_DOCS, EXTERNAL_DOC_PATH)
-        print(f"✅ Copied model reference directory to {EXTERNAL_DOC_PATH}")
+    Returns True if the file was written.
+    """
+    try:
+        output_path = EXTERNAL_REF_PATH / md_file.name
+        # Copies carry their source's mtime, as in sync_tree: any difference,
+        # older or newer (e.g. after a checkout), means the copy may be stale
+        src_mtime_ns = md_file.stat().st_mtime_ns
+        if output_path.is_file() and output_path.stat().st_mtime_ns == src_mtime_ns:
+            print(f"⏭️  {md_file} is unchanged since the last copy")
+            return False
+
+        # Work on raw bytes: the edits below are ASCII, so no decode/encode
+        content = md_file.read_bytes()
+
+        # Replace "docs/" links with empty strings
+        content = content.replace(b"(docs/", b"(")
+
+        # Source touched but content unchanged: keep the previous copy and only
+        # stamp it with the source mtime so the next run skips it up front
+        if output_path.is_file():
+            previous = output_path.read_bytes()
+            if previous.rpartition(_FOOTER_SEPARATOR)[0] == content:
+                os.utime(output_path, ns=(src_mtime_ns, src_mtime_ns))
+                print(f"⏭️  {md_file} content is unchanged")
+                return False
+
+        # Write the content with footer to the output directory in one call
+        output_path.write_bytes(b"%s\n%s" % (content, footer))
+        os.utime(output_path, ns=(src_mtime_ns, src_mtime_ns))
+
+        print(f"✅ Copied {md_file} to {output_path} (with footer)")
+        return True
     except Exception as e:
-        print(f"⚠️  Failed to copy to external directory: {e}")
+        print(f"⚠️  Failed to copy {md_file}: {e}")
+        return False
 
 
 def copy_to_docs_dir() -> None:
@@ -830,7 +978,12 @@ def copy_to_docs_dir() -> None:
         return
 
     # Get all .md files from docs directory
-    docs_md_files = list(LOCAL_DOCS.glob("*.md"))
+    with os.scandir(LOCAL_DOCS) as entries:
+        docs_md_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".md") and entry.is_file()
+        ]
     print(f"docs_md_files: {docs_md_files}")
 
     # Add root directory markdown files
@@ -843,30 +996,15 @@ def copy_to_docs_dir() -> None:
 
     # Combine all markdown files
     md_files = docs_md_files + [f for f in root_md_files if f.exists()]
+    footer = add_footer().encode()
 
-    for md_file in md_files:
-        try:
-            # Read the content of the markdown file
-            content = md_file.read_text()
-
-            # Replace "docs/" links with empty strings
-            content = content.replace("(docs/", "(")
-
-            # Add footer to the content
-            footer_lines = add_footer()
-            content_with_footer = content + "\n" + "\n".join(footer_lines)
-
-            # Write the content with footer to the output directory
-            output_path = EXTERNAL_REF_PATH / md_file.name
-            output_path.write_text(content_with_footer)
-
-            print(f"✅ Copied {md_file} to {output_path} (with footer)")
-        except Exception as e:
-            print(f"⚠️  Failed to copy {md_file}: {e}")
+    # Files are independent and the work is pure I/O, so copy them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(md_files)))) as pool:
+        copied = sum(pool.map(partial(copy_reference_file, footer=footer), md_files))
 
     if md_files:
         print(
-            f"✅ Copied {len(md_files)} markdown files from docs/ and root to {EXTERNAL_REF_PATH}"
+            f"✅ Copied {copied} of {len(md_files)} markdown files from docs/ and root to {EXTERNAL_REF_PATH}"
         )
     else:
         print("ℹ️  No .md files found in docs/ directory or root")